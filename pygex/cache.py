@@ -0,0 +1,105 @@
+from collections import OrderedDict, namedtuple
+from typing import Callable, Hashable
+
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'evictions', 'length', 'size', 'max_size'))
+
+
+class LRUCache:
+    """
+    Least recently used cache, bounded by the total size of its items. By default the size of every item is 1, so
+    the cache is bounded by the number of items, but with `get_item_size` it can be bounded, for example, by bytes
+    """
+
+    def __init__(self, max_size: int, get_item_size: Callable[[object], int] = None):
+        """
+        :param max_size: the maximum total size of items, when it is exceeded the least recently used items are evicted
+        :param get_item_size: the function that returns the size of the cached value
+        """
+        self._items: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        self._max_size = max_size
+        self._get_item_size = get_item_size
+        self._size = 0
+
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key: Hashable):
+        return key in self._items
+
+    def __iter__(self):
+        # ATTENTION: the keys are copied, so the items can be popped during the iteration
+        return iter((*self._items,))
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, new_max_size: int):
+        self._max_size = new_max_size
+        self._evict()
+
+    @property
+    def hit_rate(self):
+        requests_number = self.hits + self.misses
+
+        return 0 if requests_number == 0 else self.hits / requests_number
+
+    @property
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._items), self._size, self._max_size)
+
+    def get(self, key: Hashable, default=None):
+        if key not in self._items:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._items.move_to_end(key)
+
+        return self._items[key][0]
+
+    def put(self, key: Hashable, value):
+        self.pop(key)
+
+        item_size = 1 if self._get_item_size is None else self._get_item_size(value)
+
+        # ATTENTION: the value that is larger than the whole cache is not stored at all, otherwise it would evict
+        # everything else
+        if item_size > self._max_size:
+            return
+
+        self._items[key] = value, item_size
+        self._size += item_size
+        self._evict()
+
+    def pop(self, key: Hashable, default=None):
+        if key not in self._items:
+            return default
+
+        value, item_size = self._items.pop(key)
+        self._size -= item_size
+
+        return value
+
+    def clear(self):
+        self._items.clear()
+        self._size = 0
+
+    def reset_statistics(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def _evict(self):
+        while self._size > self._max_size and self._items:
+            self._size -= self._items.popitem(last=False)[1][1]
+            self.evictions += 1
+
+
+__all__ = 'CacheInfo', 'LRUCache'
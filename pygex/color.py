@@ -1,8 +1,38 @@
+from pygame.constants import SRCALPHA, BLEND_RGB_MULT
+from pygex.surface import TYPE_SURFACE
 from pygame import color as pg_color
+from pygex.cache import LRUCache
 from typing import Sequence
 
+try:
+    from pygame.surfarray import pixels3d as pg_surfarray_pixels3d, pixels_alpha as pg_surfarray_pixels_alpha
+    from pygame.surfarray import pixels2d as pg_surfarray_pixels2d
+    import numpy as np
+except ImportError:
+    np = None
+
+_NUMPY_IS_REQUIRED_MESSAGE = 'For using %s needs to install numpy module first: `pip install numpy`'
+
 TYPE_COLOR = pg_color.Color | int | str | Sequence[int]
 
+COLOR_CACHE_MAX_SIZE = 1024
+COLOR_INTERPOLATION_TABLE_SIZE = 256
+COLOR_INTERPOLATION_TABLE_CACHE_MAX_SIZE = 64
+
+_COLOR_FORMAT_AHEX = 0
+_COLOR_FORMAT_RGBA = 1
+_CACHE_MISS = object()
+
+color_cache = LRUCache(COLOR_CACHE_MAX_SIZE)
+"""
+The cache of `as_ahex` and `as_rgba` results for non-int colors (strings, sequences of ints, pygame.Color), so
+parsing of the same color is just a dict lookup. It is bounded by `COLOR_CACHE_MAX_SIZE` items, the statistics are
+available by `info` and `hit_rate`
+"""
+
+color_interpolation_table_cache = LRUCache(COLOR_INTERPOLATION_TABLE_CACHE_MAX_SIZE)
+"""The cache of tables returned by `get_color_interpolation_table` keyed by the colors and the size of the table"""
+
 
 COLOR_ABSOLUTE_RED = 0xff0000
 COLOR_ABSOLUTE_GREEN = 0x00ff00
@@ -229,6 +259,26 @@ def as_ahex(color: TYPE_COLOR):
     :param color: any of: AHEX, HEX, RGBA, pygame.Color
     :return: AHEX as int
     """
+    if type(color) is int:
+        return color
+
+    return _get_cached_color(_COLOR_FORMAT_AHEX, color, _as_ahex)
+
+
+def _as_ahex(color: TYPE_COLOR):
+    # ATTENTION: str is a Sequence too, so it should be checked first
+    if isinstance(color, str):
+        if color.startswith('#'):
+            if len(color) == 7:
+                return rgb_to_hex(parse_hex(color))
+
+            if len(color) == 9:
+                return rgba_to_ahex(parse_hex(color))
+
+            return
+
+        color = pg_color.Color(color)
+
     if isinstance(color, Sequence):
         if len(color) == 3:
             return rgb_to_hex(color)
@@ -238,32 +288,21 @@ def as_ahex(color: TYPE_COLOR):
 
         return
 
-    if isinstance(color, str):
-        if isinstance(color, str):
-            if color.startswith('#'):
-                if len(color) == 7:
-                    return rgb_to_hex(parse_hex(color))
-
-                if len(color) == 9:
-                    return rgba_to_ahex(parse_hex(color))
-
-                return
-
-            color = pg_color.Color(color)
-
     if isinstance(color, pg_color.Color):
         return rgba_to_ahex(color)
 
     return color
 
 
-def as_rgba(color: TYPE_COLOR) -> tuple[int, int, int, int] | pg_color.Color | None:
+def as_rgba(color: TYPE_COLOR) -> tuple[int, int, int, int] | None:
     """
     This function can be used for converting any color to supportable color for pygame
     :param color: any of: AHEX, HEX, RGBA, pygame.Color
-    :return: RGBA as tuple or pygame.Color
+    :return: RGBA as tuple
     """
-    if isinstance(color, int):
+    color_type = type(color)
+
+    if color_type is int:
         if color == COLOR_TRANSPARENT:
             return
 
@@ -272,7 +311,14 @@ def as_rgba(color: TYPE_COLOR) -> tuple[int, int, int, int] | pg_color.Color | N
 
         return ahex_to_rgba(color | 0xff << 24)
 
-    if isinstance(color, Sequence) and len(color) < 4:
+    if color_type is tuple and len(color) == 4:
+        return color
+
+    return _get_cached_color(_COLOR_FORMAT_RGBA, color, _as_rgba)
+
+
+def _as_rgba(color: TYPE_COLOR):
+    if isinstance(color, Sequence) and not isinstance(color, str) and len(color) < 4:
         return *color, 0xff  # converting rgb to rgba
 
     if isinstance(color, str):
@@ -285,13 +331,421 @@ def as_rgba(color: TYPE_COLOR) -> tuple[int, int, int, int] | pg_color.Color | N
 
             return
 
-        return pg_color.Color(color)
+        return (*pg_color.Color(color),)
 
-    return color
+    return (*color,)
+
+
+def _get_cached_color(color_format: int, color: TYPE_COLOR, convert):
+    # ATTENTION: mutable colors (lists, pygame.Color) are keyed by their channels, and the results are always tuples,
+    # so the cached value cannot be changed by the caller
+    color_type = type(color)
+
+    # ATTENTION: the exact type checks go first, because `isinstance` with `Sequence` is much slower
+    if color_type is str:
+        key = color_format, color
+    elif color_type is pg_color.Color:
+        key = color_format, (*color,)
+    elif color_type in (tuple, list) or isinstance(color, Sequence):
+        key = color_format, (*color,)
+
+        # ATTENTION: the tuples of equal ints and floats are equal keys, so only the colors of ints are cached,
+        # otherwise the result for the color of floats could be the cached result for the color of ints and vice versa
+        for channel in key[1]:
+            if type(channel) is not int:
+                return convert(color)
+    else:
+        return color
+
+    converted_color = color_cache.get(key, _CACHE_MISS)
+
+    if converted_color is _CACHE_MISS:
+        converted_color = convert(color)
+        color_cache.put(key, converted_color)
+
+    return converted_color
+
+
+def as_ahex_array(colors):
+    """
+    Batch version of `as_ahex` (requires `numpy`)
+    :param colors: `numpy` array of AHEX (or HEX) ints of any shape, or a sequence of any colors
+    :return: `numpy` array of AHEX as int64, transparent colors are `COLOR_TRANSPARENT`
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`as_ahex_array`')
+
+    if isinstance(colors, np.ndarray):
+        return colors.astype(np.int64)
+
+    ahex_colors = []
+
+    for color in colors:
+        ahex_color = as_ahex(color)
+
+        if ahex_color is None:
+            raise ValueError(f'Invalid color `{color}`')
+
+        ahex_colors.append(ahex_color)
+
+    return np.array(ahex_colors, dtype=np.int64)
+
+
+def as_rgba_array(colors):
+    """
+    Batch version of `as_rgba` (requires `numpy`)
+    :param colors: `numpy` array of AHEX (or HEX) ints of any shape, or a sequence of any colors
+    :return: `numpy` array of uint8 with the extra last axis of RGBA channels, transparent colors are `(0, 0, 0, 0)`
+    """
+    colors = as_ahex_array(colors)
+
+    return ahex_to_rgba_array(np.where((colors >= 0) & (colors <= 0xffffff), colors | 0xff << 24, colors))
+
+
+def rgba_to_ahex_array(colors):
+    """
+    Batch version of `rgba_to_ahex` (requires `numpy`)
+    :param colors: `numpy` array (or nested sequence) with the last axis of RGBA channels
+    :return: `numpy` array of AHEX as int64
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`rgba_to_ahex_array`')
+
+    colors = np.asarray(colors, dtype=np.int64) & 0xff
+
+    return colors[..., 3] << 24 | colors[..., 0] << 16 | colors[..., 1] << 8 | colors[..., 2]
+
+
+def ahex_to_rgba_array(colors):
+    """
+    Batch version of `ahex_to_rgba` (requires `numpy`)
+    :param colors: `numpy` array (or sequence) of AHEX ints
+    :return: `numpy` array of uint8 with the extra last axis of RGBA channels, transparent colors are `(0, 0, 0, 0)`
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`ahex_to_rgba_array`')
+
+    colors = np.asarray(colors, dtype=np.int64)
+    colors = np.where(colors == COLOR_TRANSPARENT, 0, colors)
+
+    return np.stack((colors >> 16, colors >> 8, colors, colors >> 24), axis=-1).astype(np.uint8)
+
+
+def ahex_to_hexa_array(colors):
+    """
+    Batch version of `ahex_to_hexa` (requires `numpy`)
+    :param colors: `numpy` array (or sequence) of AHEX ints
+    :return: `numpy` array of HEXA as int64, transparent colors stay `COLOR_TRANSPARENT`
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`ahex_to_hexa_array`')
+
+    colors = np.asarray(colors, dtype=np.int64)
+
+    return np.where(colors == COLOR_TRANSPARENT, COLOR_TRANSPARENT, (colors & 0xffffff) << 8 | (colors >> 24) & 0xff)
+
+
+def invert_array(colors, invert_alpha=False):
+    """
+    Batch version of `invert` (requires `numpy`)
+    :param colors: `numpy` array of AHEX (or HEX) ints of any shape, or a sequence of any colors
+    :return: `numpy` array of AHEX as int64, transparent colors stay `COLOR_TRANSPARENT`
+    """
+    colors = as_ahex_array(colors)
+    alphas = (colors >> 24) & 0xff
+
+    if invert_alpha:
+        alphas = ~alphas & 0xff
+
+    return np.where(colors == COLOR_TRANSPARENT, COLOR_TRANSPARENT, alphas << 24 | ~colors & 0xffffff)
+
+
+def to_gray_array(colors):
+    """
+    Batch version of `to_gray` (requires `numpy`)
+    :param colors: `numpy` array of AHEX (or HEX) ints of any shape, or a sequence of any colors
+    :return: `numpy` array of AHEX as int64, transparent colors stay `COLOR_TRANSPARENT`
+    """
+    colors = as_ahex_array(colors)
+    segments = (((colors >> 16) & 0xff) * 299 + ((colors >> 8) & 0xff) * 587 + (colors & 0xff) * 114) // 1000
+
+    return np.where(
+        colors == COLOR_TRANSPARENT,
+        COLOR_TRANSPARENT,
+        (colors >> 24 & 0xff) << 24 | segments << 16 | segments << 8 | segments
+    )
+
+
+def to_black_white_array(colors):
+    """
+    Batch version of `to_black_white` (requires `numpy`)
+    :param colors: `numpy` array of AHEX (or HEX) ints of any shape, or a sequence of any colors
+    :return: `numpy` array of AHEX as int64, transparent colors stay `COLOR_TRANSPARENT`
+    """
+    colors = to_gray_array(colors)
+
+    return np.where(
+        colors == COLOR_TRANSPARENT,
+        COLOR_TRANSPARENT,
+        colors & 0xff000000 | np.where(colors & 0xff < 0x7f, 0x000000, 0xffffff)
+    )
+
+
+def _srgb_to_linear(segment: int):
+    segment /= 0xff
+
+    return segment / 12.92 if segment <= 0.04045 else ((segment + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float):
+    value = 12.92 * value if value <= 0.0031308 else 1.055 * max(value, 0) ** (1 / 2.4) - 0.055
+
+    return min(max(round(value * 0xff), 0x00), 0xff)
+
+
+def _rgb_to_oklab(color: Sequence[int]):
+    r, g, b = _srgb_to_linear(color[0]), _srgb_to_linear(color[1]), _srgb_to_linear(color[2])
+
+    l = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+
+    return (
+        0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+        1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+        0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s
+    )
+
+
+def _oklab_to_rgb(color: Sequence[float]):
+    l = (color[0] + 0.3963377774 * color[1] + 0.2158037573 * color[2]) ** 3
+    m = (color[0] - 0.1055613458 * color[1] - 0.0638541728 * color[2]) ** 3
+    s = (color[0] - 0.0894841775 * color[1] - 1.2914855480 * color[2]) ** 3
+
+    return (
+        _linear_to_srgb(4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s),
+        _linear_to_srgb(-1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s),
+        _linear_to_srgb(-0.0041960863 * l - 0.7034186948 * m + 1.7076147010 * s)
+    )
+
+
+def get_color_interpolation_table(colors: Sequence[TYPE_COLOR], size: int = COLOR_INTERPOLATION_TABLE_SIZE):
+    """
+    Precomputed smooth transition between the colors, interpolated in the perceptual OKLab color space (alpha is
+    interpolated linearly). The tables are saved in `color_interpolation_table_cache`, so an animation step is just
+    an index into the table
+    :param colors: two or more colors, evenly spread over the table, `COLOR_TRANSPARENT` is treated as
+    the neighboring color with zero alpha
+    :param size: the number of colors in the table
+    :return: tuple of RGBA tuples, the first one is the first color and the last one is the last color
+    """
+    rgba_colors = [as_rgba(color) for color in colors]
+    key = (*((*color,) if color is not None else None for color in rgba_colors),), size
+    table = color_interpolation_table_cache.get(key)
+
+    if table is not None:
+        return table
+
+    if len(rgba_colors) < 2 or all(color is None for color in rgba_colors):
+        raise ValueError('For interpolation at least two colors are needed, and not all of them can be transparent')
+
+    # ATTENTION: transparent colors take the color of their opaque neighbor, otherwise a fading to transparent would
+    # pass through black
+    for i, color in enumerate(rgba_colors):
+        if color is None:
+            neighbor_color = next(
+                rgba_colors[j] for j in (*range(i - 1, -1, -1), *range(i + 1, len(rgba_colors)))
+                if rgba_colors[j] is not None
+            )
+            rgba_colors[i] = *neighbor_color[:3], 0x00
+
+    rgba_colors = [(*color, 0xff) if len(color) == 3 else (*color,) for color in rgba_colors]
+    lab_colors = [_rgb_to_oklab(color) for color in rgba_colors]
+
+    table = []
+    segments_number = len(rgba_colors) - 1
+
+    for i in range(size):
+        position = i / (size - 1) * segments_number if size > 1 else 0
+        segment_index = min(int(position), segments_number - 1)
+        fraction = position - segment_index
+
+        start_lab, end_lab = lab_colors[segment_index], lab_colors[segment_index + 1]
+        start_alpha, end_alpha = rgba_colors[segment_index][3], rgba_colors[segment_index + 1][3]
+
+        table.append((
+            *_oklab_to_rgb([start + (end - start) * fraction for start, end in zip(start_lab, end_lab)]),
+            round(start_alpha + (end_alpha - start_alpha) * fraction)
+        ))
+
+    table = (*table,)
+    color_interpolation_table_cache.put(key, table)
+
+    return table
+
+
+def interpolate_color(colors: Sequence[TYPE_COLOR], progress: float, size: int = COLOR_INTERPOLATION_TABLE_SIZE):
+    """
+    Getting the color of the transition between the colors by `get_color_interpolation_table`
+    :param colors: two or more colors, evenly spread over the transition
+    :param progress: value from 0 to 1
+    :param size: the number of colors in the table, which is the number of distinguishable steps of the transition
+    :return: RGBA as tuple
+    """
+    return get_color_interpolation_table(colors, size)[round(min(max(progress, 0), 1) * (size - 1))]
+
+
+def _prepare_dest_surface(source_surface: TYPE_SURFACE, dest_surface: TYPE_SURFACE | None):
+    if dest_surface is None:
+        return source_surface.copy()
+
+    if dest_surface is not source_surface:
+        pg_surfarray_pixels3d(dest_surface)[...] = pg_surfarray_pixels3d(source_surface)
+
+        if dest_surface.get_flags() & SRCALPHA:
+            pg_surfarray_pixels_alpha(dest_surface)[...] = pg_surfarray_pixels_alpha(source_surface) \
+                if source_surface.get_flags() & SRCALPHA else 0xff
+
+    return dest_surface
+
+
+def _get_gray_segments(pixels, shifts: Sequence[int]):
+    # ATTENTION: the packed pixels are processed with the reused temporary arrays, because every new array
+    # of the size of the whole Surface costs almost as much as the arithmetic itself
+    segments = np.right_shift(pixels, shifts[0])
+    segments &= 0xff
+    segments *= 299
+
+    channel = np.right_shift(pixels, shifts[1])
+    channel &= 0xff
+    channel *= 587
+    segments += channel
+
+    np.right_shift(pixels, shifts[2], out=channel)
+    channel &= 0xff
+    channel *= 114
+    segments += channel
+
+    segments //= 1000
+
+    return segments
+
+
+def _set_gray_segments(surface: TYPE_SURFACE, pixels, segments):
+    shifts = surface.get_shifts()
+
+    segments *= (1 << shifts[0]) | (1 << shifts[1]) | (1 << shifts[2])
+    pixels &= ~np.uint32(sum(surface.get_masks()[:3]))
+    pixels |= segments
+
+
+def invert_surface(source_surface: TYPE_SURFACE, invert_alpha=False, dest_surface: TYPE_SURFACE = None):
+    """
+    Surface version of `invert` (requires `numpy`)
+    :param source_surface: source Surface
+    :param invert_alpha: if true, then the alpha channel is inverted too, otherwise it is kept
+    :param dest_surface: the Surface of the same size into which the result will be written, can be the source itself
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`invert_surface`')
+
+    dest_surface = _prepare_dest_surface(source_surface, dest_surface)
+
+    if dest_surface.get_bytesize() != 4:
+        pg_surfarray_pixels3d(dest_surface)[...] ^= 0xff
+
+        if invert_alpha and dest_surface.get_flags() & SRCALPHA:
+            pg_surfarray_pixels_alpha(dest_surface)[...] ^= 0xff
+
+        return dest_surface
+
+    masks = dest_surface.get_masks()
+    pg_surfarray_pixels2d(dest_surface)[...] ^= np.uint32(sum(masks) if invert_alpha else sum(masks[:3]))
+
+    return dest_surface
+
+
+def to_gray_surface(source_surface: TYPE_SURFACE, dest_surface: TYPE_SURFACE = None):
+    """
+    Surface version of `to_gray`, the alpha channel is kept (requires `numpy`)
+    :param source_surface: source Surface
+    :param dest_surface: the Surface of the same size into which the result will be written, can be the source itself
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`to_gray_surface`')
+
+    dest_surface = _prepare_dest_surface(source_surface, dest_surface)
+
+    if dest_surface.get_bytesize() != 4:
+        pixels = pg_surfarray_pixels3d(dest_surface)
+        pixels[...] = _get_gray_segments_by_channels(pixels)[..., None]
+
+        return dest_surface
+
+    pixels = pg_surfarray_pixels2d(dest_surface).T
+    _set_gray_segments(dest_surface, pixels, _get_gray_segments(pixels, dest_surface.get_shifts()))
+
+    return dest_surface
+
+
+def to_black_white_surface(source_surface: TYPE_SURFACE, dest_surface: TYPE_SURFACE = None):
+    """
+    Surface version of `to_black_white`, the alpha channel is kept (requires `numpy`)
+    :param source_surface: source Surface
+    :param dest_surface: the Surface of the same size into which the result will be written, can be the source itself
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`to_black_white_surface`')
+
+    dest_surface = _prepare_dest_surface(source_surface, dest_surface)
+
+    if dest_surface.get_bytesize() != 4:
+        pixels = pg_surfarray_pixels3d(dest_surface)
+        pixels[...] = np.where(_get_gray_segments_by_channels(pixels) < 0x7f, 0x00, 0xff).astype(np.uint8)[..., None]
+
+        return dest_surface
+
+    pixels = pg_surfarray_pixels2d(dest_surface).T
+    segments = _get_gray_segments(pixels, dest_surface.get_shifts()) >= 0x7f
+    _set_gray_segments(dest_surface, pixels, segments.astype(np.uint32) * 0xff)
+
+    return dest_surface
+
+
+def _get_gray_segments_by_channels(pixels):
+    return (pixels[..., 0] * np.uint32(299) + pixels[..., 1] * np.uint32(587) + pixels[..., 2] * np.uint32(114)) \
+        // 1000
+
+
+def tint_surface(source_surface: TYPE_SURFACE, color: TYPE_COLOR, dest_surface: TYPE_SURFACE = None):
+    """
+    Multiplying the color of every pixel by the color, the alpha channel is kept (the same as the `tint` operation
+    of `pygex.transform.TransformPipeline`)
+    :param source_surface: source Surface
+    :param color: the color by which the pixels are multiplied
+    :param dest_surface: the Surface of the same size into which the result will be written, can be the source itself
+    """
+    if dest_surface is None:
+        dest_surface = source_surface.copy()
+    elif dest_surface is not source_surface:
+        dest_surface.fill((0, 0, 0, 0))
+        dest_surface.blit(source_surface, (0, 0))
+
+    color = as_rgba(color)
+
+    if color is not None:
+        dest_surface.fill(color[:3], special_flags=BLEND_RGB_MULT)
+
+    return dest_surface
 
 
 __all__ = (
     'TYPE_COLOR',
+    'COLOR_CACHE_MAX_SIZE',
+    'COLOR_INTERPOLATION_TABLE_SIZE',
+    'COLOR_INTERPOLATION_TABLE_CACHE_MAX_SIZE',
+    'color_cache',
+    'color_interpolation_table_cache',
     'COLOR_ABSOLUTE_RED',
     'COLOR_ABSOLUTE_GREEN',
     'COLOR_ABSOLUTE_BLUE',
@@ -350,5 +804,19 @@ __all__ = (
     'to_black_white',
     'as_ahex',
     'as_rgba',
-    'to_readable_color'
+    'to_readable_color',
+    'as_ahex_array',
+    'as_rgba_array',
+    'rgba_to_ahex_array',
+    'ahex_to_rgba_array',
+    'ahex_to_hexa_array',
+    'invert_array',
+    'to_gray_array',
+    'to_black_white_array',
+    'get_color_interpolation_table',
+    'interpolate_color',
+    'invert_surface',
+    'to_gray_surface',
+    'to_black_white_surface',
+    'tint_surface'
 )
@@ -37,7 +37,8 @@ class DebugPanel(Flippable):
                 set_alpha(COLOR_BLACK, 0xaa),
                 border_radius_or_radii=(0,) * 3 + (10,)
             ),
-            prerender_during_initialization=False
+            prerender_during_initialization=False,
+            use_glyph_atlas=True
         )
 
         self.close_button = ButtonView(
@@ -1,10 +1,58 @@
 from pygame.draw import line as pg_draw_line, rect as pg_draw_rect, ellipse as pg_draw_ellipse
+from pygame.draw import lines as pg_draw_lines, aalines as pg_draw_aalines, polygon as pg_draw_polygon
 from pygex.color import TYPE_COLOR, COLOR_TRANSPARENT, as_rgba
 from pygex.surface import AlphaSurface, TYPE_SURFACE
 from pygex.core.constants import MAX_BORDER_RADIUS
 from pygame.rect import Rect as pg_Rect
+from pygex.cache import LRUCache
 from typing import Sequence
-from math import ceil
+from math import ceil, floor, acos, pi
+
+try:
+    from pygame.surfarray import pixels2d as pg_surfarray_pixels2d
+    import numpy as np
+except ImportError:
+    np = None
+
+_NUMPY_IS_REQUIRED_MESSAGE = 'For using %s needs to install numpy module first: `pip install numpy`'
+
+RECT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+GRID_TILE_CACHE_MAX_SIZE = 16
+GRID_TILE_MIN_SIZE = 128
+
+DRAW_COMMAND_RECT = 'rect'
+DRAW_COMMAND_GRID = 'grid'
+DRAW_COMMAND_LINE = 'line'
+DRAW_COMMAND_ELLIPSE = 'ellipse'
+DRAW_COMMAND_BLIT = 'blit'
+
+STROKE_JOIN_ROUND = 'round'
+STROKE_JOIN_MITER = 'miter'
+STROKE_JOIN_BEVEL = 'bevel'
+
+STROKE_CAP_ROUND = 'round'
+STROKE_CAP_SQUARE = 'square'
+STROKE_CAP_BUTT = 'butt'
+
+DEFAULT_STROKE_MITER_LIMIT = 4
+STROKE_ROUND_TOLERANCE = 0.25
+
+
+rect_cache = LRUCache(
+    RECT_CACHE_MAX_BYTES,
+    lambda surface: surface.get_width() * surface.get_height() * surface.get_bytesize()
+)
+"""
+The cache of rect sprites rendered by `rect(..., cached=True)` keyed by the size, colors, border width and radii.
+The size of the cache is bounded by the number of bytes `RECT_CACHE_MAX_BYTES` (can be changed by `max_size`), and its
+statistics are available by `info`
+"""
+
+grid_tile_cache = LRUCache(GRID_TILE_CACHE_MAX_SIZE)
+"""
+The cache of grid tiles rendered by `grid(..., cached=True)`, the pair of tiles of the vertical and the horizontal lines
+for every zoom level and line style
+"""
 
 
 def grid(
@@ -13,7 +61,10 @@ def grid(
         scale_interval: float | int,
         bounds: Sequence[float | int] | pg_Rect,
         offset: Sequence[float | int] = (0, 0),
-        line_width: int = 1
+        line_width: int = 1,
+        major_line_color: TYPE_COLOR = COLOR_TRANSPARENT,
+        major_line_interval: int = 0,
+        cached=False
 ):
     """
     Drawing the basic grid
@@ -23,8 +74,35 @@ def grid(
     :param bounds: grid bounds in which the grid will be drawn
     :param offset: offset of drawing inside grid bounds
     :param line_width: grid line width
+    :param major_line_color: color of every `major_line_interval`-th grid line
+    :param major_line_interval: number of grid intervals between major lines, if 0, then there are no major lines
+    :param cached: if true, then the grid cell is rendered once into a tile that is saved in `grid_tile_cache`,
+    and the grid is drawn by blitting this tile (only for integer `scale_interval` and opaque colors).
+    ATTENTION: in this mode the thick lines are cut off at the bounds
     """
     line_color = as_rgba(line_color)
+    major_line_color = as_rgba(major_line_color) if major_line_interval > 0 else None
+
+    # ATTENTION: the lines are drawn by writing the color as is, but the tile is blitted with the alpha blending, so
+    # the grid of non-opaque colors is drawn by the lines, otherwise it would look different in the cached mode
+    if (
+            cached
+            and scale_interval == int(scale_interval)
+            and scale_interval > 0
+            and line_color[3] == 255
+            and (major_line_color is None or major_line_color[3] == 255)
+    ):
+        _draw_grid_by_tiles(
+            surface,
+            line_color,
+            int(scale_interval),
+            bounds,
+            offset,
+            line_width,
+            major_line_color,
+            major_line_interval
+        )
+        return
 
     for ix in range(1, ceil(bounds[2] / scale_interval + 1)):
         x = bounds[0] + ix * scale_interval - offset[0] % scale_interval
@@ -32,7 +110,14 @@ def grid(
         if x > bounds[0] + bounds[2] or x < bounds[0]:
             continue
 
-        pg_draw_line(surface, line_color, (x, bounds[1]), (x, bounds[1] + bounds[3]), line_width)
+        pg_draw_line(
+            surface,
+            _get_grid_line_color(x - bounds[0] + offset[0], scale_interval, line_color, major_line_color,
+                                 major_line_interval),
+            (x, bounds[1]),
+            (x, bounds[1] + bounds[3]),
+            line_width
+        )
 
     for iy in range(1, ceil(bounds[3] / scale_interval + 1)):
         y = bounds[1] + iy * scale_interval - offset[1] % scale_interval
@@ -40,7 +125,93 @@ def grid(
         if y > bounds[1] + bounds[3] or y < bounds[1]:
             continue
 
-        pg_draw_line(surface, line_color, (bounds[0], y), (bounds[0] + bounds[2], y), line_width)
+        pg_draw_line(
+            surface,
+            _get_grid_line_color(y - bounds[1] + offset[1], scale_interval, line_color, major_line_color,
+                                 major_line_interval),
+            (bounds[0], y),
+            (bounds[0] + bounds[2], y),
+            line_width
+        )
+
+
+def _get_grid_line_color(
+        grid_position: float | int,
+        scale_interval: float | int,
+        line_color: tuple | None,
+        major_line_color: tuple | None,
+        major_line_interval: int
+):
+    if major_line_color is not None and round(grid_position / scale_interval) % major_line_interval == 0:
+        return major_line_color
+
+    return line_color
+
+
+def _draw_grid_by_tiles(
+        surface: TYPE_SURFACE,
+        line_color: tuple | None,
+        scale_interval: int,
+        bounds: Sequence[float | int] | pg_Rect,
+        offset: Sequence[float | int],
+        line_width: int,
+        major_line_color: tuple | None,
+        major_line_interval: int
+):
+    # ATTENTION: the tile always contains a whole number of major intervals, and it is not too small, otherwise the grid
+    # of a small interval would consist of thousands of blits
+    tile_intervals_number = major_line_interval if major_line_color is not None else 1
+    tile_intervals_number *= ceil(GRID_TILE_MIN_SIZE / (scale_interval * tile_intervals_number))
+    tile_size = scale_interval * tile_intervals_number
+
+    tile_key = scale_interval, line_color, line_width, major_line_color, major_line_interval
+    tile_surfaces = grid_tile_cache.get(tile_key)
+
+    if tile_surfaces is None:
+        vertical_tile_surface = AlphaSurface((tile_size, tile_size))
+        horizontal_tile_surface = AlphaSurface((tile_size, tile_size))
+
+        # ATTENTION: the lines are drawn on both edges of the tile, so thick lines are continued on the neighboring
+        # tiles
+        lines = []
+
+        for i in range(tile_intervals_number + 1):
+            position = i * scale_interval
+            color = _get_grid_line_color(position, scale_interval, line_color, major_line_color, major_line_interval)
+
+            if color is not None:
+                lines.append((position, color))
+
+        for position, color in lines:
+            pg_draw_line(vertical_tile_surface, color, (position, 0), (position, tile_size), line_width)
+            pg_draw_line(horizontal_tile_surface, color, (0, position), (tile_size, position), line_width)
+
+        tile_surfaces = vertical_tile_surface, horizontal_tile_surface
+        grid_tile_cache.put(tile_key, tile_surfaces)
+
+    start_x = int(bounds[0] - offset[0] % tile_size)
+    start_y = int(bounds[1] - offset[1] % tile_size)
+    end_x, end_y = bounds[0] + bounds[2], bounds[1] + bounds[3]
+    tile_positions = [
+        (x, y)
+        for x in range(start_x, floor(end_x) + 1, tile_size)
+        for y in range(start_y, floor(end_y) + 1, tile_size)
+    ]
+
+    # ATTENTION: as in the line drawing mode, the lines reach the right and bottom edges of the bounds, but there is
+    # no vertical line on the left edge and no horizontal line on the top edge, so the vertical and the horizontal lines
+    # are blitted separately with different clips, and the horizontal lines are drawn over the vertical ones
+    clip_rects = (
+        pg_Rect(bounds[0] + 1, bounds[1], bounds[2], bounds[3] + 1),
+        pg_Rect(bounds[0], bounds[1] + 1, bounds[2] + 1, bounds[3])
+    )
+    old_clip = surface.get_clip()
+
+    for tile_surface, clip_rect in zip(tile_surfaces, clip_rects):
+        surface.set_clip(clip_rect.clip(old_clip))
+        surface.blits([(tile_surface, position) for position in tile_positions], doreturn=False)
+
+    surface.set_clip(old_clip)
 
 
 def rect(
@@ -50,7 +221,8 @@ def rect(
         border_color: TYPE_COLOR = COLOR_TRANSPARENT,
         border_width: int = 0,
         border_radii: Sequence[int] = (0, 0, 0, 0),
-        apply_alpha_color_over_surface=True
+        apply_alpha_color_over_surface=True,
+        cached=False
 ):
     """
     This method has an advantage over a similar method from pygame such as:
@@ -58,9 +230,39 @@ def rect(
     - allows to set the border color independently of the main color
     - allows to draw the border together with the main part
     - with a radius value of -1 for any of the corners, draws all corners rounded as far as possible
+    - with `cached=True` the rendered rect is saved in `rect_cache`, so drawing of the same rect is just one blit
+    (only together with `apply_alpha_color_over_surface=True`)
     """
     draw_like_ellipse = MAX_BORDER_RADIUS in border_radii
 
+    if apply_alpha_color_over_surface and cached:
+        rect_key = (
+            int(_rect[2]),
+            int(_rect[3]),
+            None if color == COLOR_TRANSPARENT else (*as_rgba(color),),
+            None if border_color == COLOR_TRANSPARENT or border_width <= 0 else (*as_rgba(border_color),),
+            border_width,
+            (MAX_BORDER_RADIUS,) if draw_like_ellipse else (*border_radii,)
+        )
+        surface_for_render = rect_cache.get(rect_key)
+
+        if surface_for_render is None:
+            surface_for_render = AlphaSurface(_rect[2:])
+
+            rect(
+                surface_for_render,
+                color,
+                (0, 0, *_rect[2:]),
+                border_color,
+                border_width,
+                border_radii,
+                apply_alpha_color_over_surface=False
+            )
+            rect_cache.put(rect_key, surface_for_render)
+
+        surface.blit(surface_for_render, _rect[:2])
+        return
+
     if apply_alpha_color_over_surface:
         surface_for_render = AlphaSurface(_rect[2:])
         rect_for_render = (0, 0, *_rect[2:])
@@ -88,4 +290,449 @@ def rect(
         surface.blit(surface_for_render, _rect[:2])
 
 
-__all__ = 'grid', 'rect'
+def get_stroke_outline(
+        points: Sequence[Sequence[float | int]],
+        width: float | int,
+        join=STROKE_JOIN_ROUND,
+        cap=STROKE_CAP_ROUND,
+        miter_limit: float | int = DEFAULT_STROKE_MITER_LIMIT
+):
+    """
+    Building the outline polygon of the thick polyline (requires `numpy`)
+    :param points: the points of the polyline, for example, the result of `pygex.math.generate_curve`
+    :param width: the width of the stroke
+    :param join: the shape of the outer corners, one of `STROKE_JOIN_*`
+    :param cap: the shape of the ends, one of `STROKE_CAP_*`
+    :param miter_limit: the maximum ratio of the miter length to the width, longer miters are beveled
+    :return: `numpy` array of floats with the shape `(points_number, 2)`
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`get_stroke_outline`')
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+
+    if len(points) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+
+    # ATTENTION: zero length segments do not have direction, so they are removed
+    points = points[np.concatenate(((True,), np.any(points[1:] != points[:-1], axis=1)))]
+
+    if len(points) == 1:
+        points = np.concatenate((points, points + (1e-3, 0)))
+
+    radius = width / 2
+    round_step = pi / 4
+
+    if radius > STROKE_ROUND_TOLERANCE:
+        round_step = min(round_step, 2 * acos(1 - STROKE_ROUND_TOLERANCE / radius))
+
+    unit_vectors = np.diff(points, axis=0)
+    lengths = np.hypot(unit_vectors[:, 0], unit_vectors[:, 1])
+    unit_vectors /= lengths[:, None]
+
+    # ATTENTION: dense polylines (like generated curves) are thinned out before building the outline, because
+    # the polygon filling time grows with the number of its vertexes. The dropped points deviate from the kept
+    # chords by less than `STROKE_ROUND_TOLERANCE`, while the curvature radius is not less than the stroke radius,
+    # and sharp corners are always kept
+    if len(points) > 2:
+        min_distance = (8 * max(radius, 1) * STROKE_ROUND_TOLERANCE) ** 0.5
+        distance_buckets = np.floor(np.concatenate(((0,), np.cumsum(lengths))) / min_distance)
+        turn_cosines = np.einsum('ij,ij->i', unit_vectors[:-1], unit_vectors[1:])
+
+        is_kept = np.empty(len(points), dtype=bool)
+        is_kept[0] = is_kept[-1] = True
+        is_kept[1:-1] = (distance_buckets[1:-1] != distance_buckets[:-2]) | (turn_cosines < np.cos(round_step))
+
+        if not is_kept.all():
+            points = points[is_kept]
+            unit_vectors = np.diff(points, axis=0)
+            unit_vectors /= np.hypot(unit_vectors[:, 0], unit_vectors[:, 1])[:, None]
+
+    normals = np.stack((-unit_vectors[:, 1], unit_vectors[:, 0]), axis=1)
+
+    # ATTENTION: the ends use the normal of their only segment, so they are processed as straight joins
+    vertex_indexes = np.arange(len(points))
+    normals_in = normals[np.maximum(vertex_indexes - 1, 0)]
+    normals_out = normals[np.minimum(vertex_indexes, len(normals) - 1)]
+
+    dot = np.clip(np.einsum('ij,ij->i', normals_in, normals_out), -1, 1)
+    cross = normals_in[:, 0] * normals_out[:, 1] - normals_in[:, 1] * normals_out[:, 0]
+    turn_angles = np.arctan2(cross, dot)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        miter_vectors = (normals_in + normals_out) / (1 + dot)[:, None]
+        miter_ratios = np.sqrt(2 / (1 + dot))
+
+    is_miter_exceeded = ~(miter_ratios <= miter_limit)
+    left_side = _get_stroke_side(points, radius, normals_in, turn_angles, miter_vectors, is_miter_exceeded,
+                                 cross < 0, 1, join, round_step)
+    right_side = _get_stroke_side(points, radius, normals_in, turn_angles, miter_vectors, is_miter_exceeded,
+                                  cross > 0, -1, join, round_step)[::-1]
+
+    end_cap = _get_stroke_cap(points[-1], unit_vectors[-1], normals[-1], radius, cap, round_step)
+    start_cap = _get_stroke_cap(points[0], -unit_vectors[0], -normals[0], radius, cap, round_step)
+
+    return np.concatenate((left_side, end_cap, right_side, start_cap))
+
+
+def _get_stroke_side(
+        points,
+        radius: float,
+        normals_in,
+        turn_angles,
+        miter_vectors,
+        is_miter_exceeded,
+        is_outer,
+        side_sign: int,
+        join: str,
+        round_step: float
+):
+    if join == STROKE_JOIN_ROUND:
+        outer_points_numbers = np.where(
+            np.abs(turn_angles) < round_step,
+            1,
+            np.ceil(np.abs(turn_angles) / round_step).astype(np.int64) + 1
+        )
+    elif join == STROKE_JOIN_MITER:
+        outer_points_numbers = np.where(is_miter_exceeded, 2, 1)
+    elif join == STROKE_JOIN_BEVEL:
+        outer_points_numbers = np.full(len(points), 2)
+    else:
+        raise ValueError(f'Unknown stroke join `{join}`')
+
+    # ATTENTION: the inner side of the corner is always the intersection of the offset segments, unless it is too
+    # far away, for example, when the polyline turns back
+    points_numbers = np.where(is_outer, outer_points_numbers, np.where(is_miter_exceeded, 2, 1))
+
+    side_vertex_indexes = np.repeat(np.arange(len(points)), points_numbers)
+    starts = np.cumsum(points_numbers) - points_numbers
+    fractions = (np.arange(len(side_vertex_indexes)) - starts[side_vertex_indexes]) \
+        / np.maximum(points_numbers - 1, 1)[side_vertex_indexes]
+
+    start_angles = np.arctan2(normals_in[:, 1], normals_in[:, 0]) + (0 if side_sign > 0 else pi)
+    angles = start_angles[side_vertex_indexes] + turn_angles[side_vertex_indexes] * fractions
+
+    side_points = points[side_vertex_indexes] + radius * np.stack((np.cos(angles), np.sin(angles)), axis=1)
+
+    is_single_point = (points_numbers == 1)[side_vertex_indexes]
+    side_points[is_single_point] = points[side_vertex_indexes[is_single_point]] \
+        + side_sign * radius * miter_vectors[side_vertex_indexes[is_single_point]]
+
+    return side_points
+
+
+def _get_stroke_cap(point, unit_vector, normal, radius: float, cap: str, round_step: float):
+    if cap == STROKE_CAP_BUTT:
+        return np.empty((0, 2), dtype=np.float64)
+
+    if cap == STROKE_CAP_SQUARE:
+        return point + radius * np.array((normal + unit_vector, unit_vector - normal))
+
+    if cap != STROKE_CAP_ROUND:
+        raise ValueError(f'Unknown stroke cap `{cap}`')
+
+    points_number = ceil(pi / round_step) + 1
+    angles = np.arctan2(normal[1], normal[0]) - np.linspace(0, pi, points_number)[1:-1]
+
+    return point + radius * np.stack((np.cos(angles), np.sin(angles)), axis=1)
+
+
+def stroke(
+        surface: TYPE_SURFACE,
+        color: TYPE_COLOR,
+        points: Sequence[Sequence[float | int]],
+        width: float | int = 1,
+        join=STROKE_JOIN_ROUND,
+        cap=STROKE_CAP_ROUND,
+        antialiasing=False,
+        miter_limit: float | int = DEFAULT_STROKE_MITER_LIMIT
+):
+    """
+    Drawing the thick polyline as one polygon, so there are no gaps between the segments, and the places where
+    the polyline overlaps itself are filled too (requires `numpy` for the width greater than 1)
+    :param surface: Surface on which the polyline will be drawn
+    :param color: stroke color
+    :param points: the points of the polyline, for example, the result of `pygex.math.generate_curve`
+    :param width: the width of the stroke
+    :param join: the shape of the outer corners, one of `STROKE_JOIN_*`
+    :param cap: the shape of the ends, one of `STROKE_CAP_*`
+    :param antialiasing: if true, then the edges of the stroke are anti-aliased
+    :param miter_limit: the maximum ratio of the miter length to the width, longer miters are beveled
+    """
+    color = as_rgba(color)
+
+    if color is None or width <= 0 or len(points) == 0:
+        return
+
+    if width <= 1:
+        if len(points) > 1:
+            (pg_draw_aalines if antialiasing else pg_draw_lines)(surface, color, False, points)
+
+        return
+
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`stroke` with the width greater than 1')
+
+    outline = get_stroke_outline(points, width, join, cap, miter_limit)
+
+    if len(outline) < 3:
+        return
+
+    # ATTENTION: `pygame.draw.polygon` fills by the even-odd rule, so the places where the stroke overlaps itself
+    # would be holes. Surfaces with 3 bytes per pixel cannot be accessed by `pixels2d`, so it is used for them anyway
+    if surface.get_bytesize() == 3:
+        pg_draw_polygon(surface, color, outline.tolist())
+    else:
+        _fill_polygon_by_nonzero_rule(surface, color, outline)
+
+    if antialiasing:
+        pg_draw_aalines(surface, color, True, outline.tolist())
+
+
+def _fill_polygon_by_nonzero_rule(surface: TYPE_SURFACE, color: Sequence[int], polygon):
+    clip_rect = surface.get_clip()
+    left = max(floor(polygon[:, 0].min()), clip_rect.left)
+    top = max(floor(polygon[:, 1].min()), clip_rect.top)
+    right = min(ceil(polygon[:, 0].max()) + 1, clip_rect.right)
+    bottom = min(ceil(polygon[:, 1].max()) + 1, clip_rect.bottom)
+
+    if left >= right or top >= bottom:
+        return
+
+    # the crossings of every edge with the centers of the pixel rows
+    edge_starts, edge_ends = polygon, np.roll(polygon, -1, axis=0)
+    start_ys, end_ys = edge_starts[:, 1] - top - 0.5, edge_ends[:, 1] - top - 0.5
+    first_rows = np.clip(np.ceil(np.minimum(start_ys, end_ys)), 0, bottom - top).astype(np.int64)
+    crossings_numbers = np.clip(np.ceil(np.maximum(start_ys, end_ys)), 0, bottom - top).astype(np.int64) - first_rows
+
+    edge_indexes = np.repeat(np.arange(len(polygon)), crossings_numbers)
+    rows = first_rows[edge_indexes] + np.arange(len(edge_indexes)) \
+        - np.repeat(np.cumsum(crossings_numbers) - crossings_numbers, crossings_numbers)
+
+    start_ys, end_ys = start_ys[edge_indexes], end_ys[edge_indexes]
+    xs = edge_starts[edge_indexes, 0] - left - 0.5 \
+        + (rows - start_ys) / (end_ys - start_ys) * (edge_ends[edge_indexes, 0] - edge_starts[edge_indexes, 0])
+    directions = np.where(end_ys > start_ys, 1, -1)
+
+    # ATTENTION: the winding number of every row returns to zero after its last crossing, so it can be accumulated
+    # through all the sorted crossings at once
+    order = np.lexsort((xs, rows))
+    rows, xs = rows[order], xs[order]
+    windings = np.cumsum(directions[order])
+    previous_windings = np.concatenate(((0,), windings[:-1]))
+
+    is_span_start = (previous_windings == 0) & (windings != 0)
+    is_span_end = (previous_windings != 0) & (windings == 0)
+    span_starts = np.clip(np.ceil(xs[is_span_start]), 0, right - left).astype(np.int64)
+    span_lengths = np.maximum(np.clip(np.ceil(xs[is_span_end]), 0, right - left).astype(np.int64) - span_starts, 0)
+
+    pixel_ys = np.repeat(rows[is_span_start], span_lengths) + top
+    pixel_xs = np.repeat(span_starts, span_lengths) + np.arange(span_lengths.sum()) \
+        - np.repeat(np.cumsum(span_lengths) - span_lengths, span_lengths) + left
+
+    pixels = pg_surfarray_pixels2d(surface)
+    pixels[pixel_xs, pixel_ys] = np.array(surface.map_rgb(color)).astype(pixels.dtype)
+    del pixels
+
+
+class DrawList:
+    """
+    Display list of draw commands, which are recorded once and then replayed onto any Surface. Consecutive blits are
+    replayed by one `Surface.blits` call, and the whole list can be baked into a Surface, that is re-rendered only
+    after the list is changed
+    """
+
+    def __init__(self, commands: Sequence[Sequence] = ()):
+        """
+        :param commands: sequence of tuples `(command, *arguments)`, where the arguments are the same as
+        the arguments of the draw list method with the name of the command, for example
+        `('line', 'red', (0, 0), (9, 9))`
+        """
+        self._commands: list[tuple] = [(*command,) for command in commands]
+        self._version = 0
+        self._baked_surface: TYPE_SURFACE | None = None
+        self._baked_version = -1
+
+    def __len__(self):
+        return len(self._commands)
+
+    @property
+    def commands(self):
+        return (*self._commands,)
+
+    @property
+    def version(self):
+        """The number that is changed every time the list is changed"""
+        return self._version
+
+    def _add_command(self, *command):
+        self._commands.append(command)
+        self._version += 1
+        return self
+
+    def clear(self):
+        self._commands.clear()
+        self._version += 1
+        return self
+
+    def rect(
+            self,
+            color: TYPE_COLOR,
+            _rect: Sequence[float | int] | pg_Rect,
+            border_color: TYPE_COLOR = COLOR_TRANSPARENT,
+            border_width: int = 0,
+            border_radii: Sequence[int] = (0, 0, 0, 0),
+            apply_alpha_color_over_surface=True,
+            cached=False
+    ):
+        return self._add_command(
+            DRAW_COMMAND_RECT,
+            color,
+            (*_rect,),
+            border_color,
+            border_width,
+            (*border_radii,),
+            apply_alpha_color_over_surface,
+            cached
+        )
+
+    def grid(
+            self,
+            line_color: TYPE_COLOR,
+            scale_interval: float | int,
+            bounds: Sequence[float | int] | pg_Rect,
+            offset: Sequence[float | int] = (0, 0),
+            line_width: int = 1,
+            major_line_color: TYPE_COLOR = COLOR_TRANSPARENT,
+            major_line_interval: int = 0,
+            cached=False
+    ):
+        return self._add_command(
+            DRAW_COMMAND_GRID,
+            line_color,
+            scale_interval,
+            (*bounds,),
+            (*offset,),
+            line_width,
+            major_line_color,
+            major_line_interval,
+            cached
+        )
+
+    def line(
+            self,
+            color: TYPE_COLOR,
+            start_pos: Sequence[float | int],
+            end_pos: Sequence[float | int],
+            width: int = 1
+    ):
+        return self._add_command(DRAW_COMMAND_LINE, color, (*start_pos,), (*end_pos,), width)
+
+    def ellipse(self, color: TYPE_COLOR, _rect: Sequence[float | int] | pg_Rect, width: int = 0):
+        return self._add_command(DRAW_COMMAND_ELLIPSE, color, (*_rect,), width)
+
+    def blit(
+            self,
+            source_surface: TYPE_SURFACE,
+            dest: Sequence[float | int],
+            area: Sequence[int] | pg_Rect | None = None,
+            special_flags: int = 0
+    ):
+        return self._add_command(DRAW_COMMAND_BLIT, source_surface, (*dest,), area, special_flags)
+
+    def replay(self, surface: TYPE_SURFACE):
+        """Executing all the commands on the Surface in the order they were recorded"""
+        blit_sequence = []
+
+        for command, *arguments in self._commands:
+            if command == DRAW_COMMAND_BLIT:
+                blit_sequence.append(arguments)
+                continue
+
+            if blit_sequence:
+                _blit_sequence(surface, blit_sequence)
+                blit_sequence = []
+
+            if command == DRAW_COMMAND_RECT:
+                rect(surface, *arguments)
+            elif command == DRAW_COMMAND_GRID:
+                grid(surface, *arguments)
+            elif command == DRAW_COMMAND_LINE:
+                color, *line_arguments = arguments
+                color = as_rgba(color)
+
+                if color is not None:
+                    pg_draw_line(surface, color, *line_arguments)
+            elif command == DRAW_COMMAND_ELLIPSE:
+                color, *ellipse_arguments = arguments
+                color = as_rgba(color)
+
+                if color is not None:
+                    pg_draw_ellipse(surface, color, *ellipse_arguments)
+            else:
+                raise ValueError(f'Unknown draw command `{command}`')
+
+        if blit_sequence:
+            _blit_sequence(surface, blit_sequence)
+
+    def bake(self, size: Sequence[int]) -> TYPE_SURFACE:
+        """
+        Replaying all the commands onto the transparent Surface of the size. The Surface is re-rendered only if the list
+        or the size was changed after the last bake. ATTENTION: the same Surface is returned by every bake, so it should
+        be copied if it is needed after the list is changed
+        """
+        size = int(size[0]), int(size[1])
+
+        if (
+                self._baked_surface is not None
+                and self._baked_version == self._version
+                and self._baked_surface.get_size() == size
+        ):
+            return self._baked_surface
+
+        if self._baked_surface is None or self._baked_surface.get_size() != size:
+            self._baked_surface = AlphaSurface(size)
+        else:
+            self._baked_surface.fill((0, 0, 0, 0))
+
+        self.replay(self._baked_surface)
+        self._baked_version = self._version
+
+        return self._baked_surface
+
+
+def _blit_sequence(surface: TYPE_SURFACE, blit_sequence: list[list]):
+    # ATTENTION: `fblits` (pygame-ce) is faster, but it does not support areas and different blend flags
+    is_simple_sequence = all(area is None and special_flags == 0 for _, _, area, special_flags in blit_sequence)
+
+    if is_simple_sequence and hasattr(surface, 'fblits'):
+        surface.fblits([(source_surface, dest) for source_surface, dest, _, _ in blit_sequence])
+    else:
+        surface.blits(blit_sequence, doreturn=False)
+
+
+__all__ = (
+    'RECT_CACHE_MAX_BYTES',
+    'GRID_TILE_CACHE_MAX_SIZE',
+    'GRID_TILE_MIN_SIZE',
+    'DRAW_COMMAND_RECT',
+    'DRAW_COMMAND_GRID',
+    'DRAW_COMMAND_LINE',
+    'DRAW_COMMAND_ELLIPSE',
+    'DRAW_COMMAND_BLIT',
+    'STROKE_JOIN_ROUND',
+    'STROKE_JOIN_MITER',
+    'STROKE_JOIN_BEVEL',
+    'STROKE_CAP_ROUND',
+    'STROKE_CAP_SQUARE',
+    'STROKE_CAP_BUTT',
+    'DEFAULT_STROKE_MITER_LIMIT',
+    'STROKE_ROUND_TOLERANCE',
+    'rect_cache',
+    'grid_tile_cache',
+    'grid',
+    'rect',
+    'get_stroke_outline',
+    'stroke',
+    'DrawList'
+)
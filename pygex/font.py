@@ -1,5 +1,8 @@
 from pygame.font import FontType, get_init, init, Font
 from pygex.resource import RESOURCES_PATH
+from pygex.cache import LRUCache
+from typing import Sequence
+from io import BytesIO
 
 
 def __get_font_resource_path(font_resource_name: str):
@@ -20,10 +23,75 @@ FONT_NOTO_SANS_SC_REGULAR = __get_font_resource_path('NotoSansSC-Regular.otf')
 DEFAULT_FONT_NAME = FONT_FIRA_CODE_REGULAR
 DEFAULT_FONT_SIZE = 15
 
-_font_buffer = {}
+FONT_CACHE_MAX_SIZE = 64
 
+_CACHED_FONT_IS_READ_ONLY_MESSAGE = 'The size and the style of the font from `font_cache` can not be changed, ' \
+                                    'because the font is shared, so get another font by `get_font` instead'
 
-def get_font(font_or_font_size: FontType | int | str = DEFAULT_FONT_SIZE, font_size: int = ...):
+
+def _raise_cached_font_is_read_only_error(*_):
+    raise AttributeError(_CACHED_FONT_IS_READ_ONLY_MESSAGE)
+
+
+def _get_cached_font_property(name: str):
+    return property(getattr(Font, name).__get__, _raise_cached_font_is_read_only_error)
+
+
+class CachedFont(Font):
+    """
+    The font of `font_cache`, which is shared by all the users of `get_font`, so its size and style can not be
+    changed and always match the key of the cache
+    """
+
+    bold = _get_cached_font_property('bold')
+    italic = _get_cached_font_property('italic')
+    underline = _get_cached_font_property('underline')
+    strikethrough = _get_cached_font_property('strikethrough')
+    point_size = _get_cached_font_property('point_size')
+
+    set_bold = set_italic = set_underline = set_strikethrough = set_point_size = _raise_cached_font_is_read_only_error
+
+    def __init__(self, file: BytesIO, size: int, bold=False, italic=False, underline=False):
+        super().__init__(file, size)
+
+        Font.set_bold(self, bold)
+        Font.set_italic(self, italic)
+        Font.set_underline(self, underline)
+
+
+font_cache = LRUCache(FONT_CACHE_MAX_SIZE)
+"""
+The cache of fonts returned by `get_font` keyed by the font file path, size and style (bold, italic, underline).
+It is bounded by `FONT_CACHE_MAX_SIZE` fonts, the statistics are available by `info` and `hit_rate`
+"""
+
+_font_files: dict[str, bytes] = {}
+
+
+def _get_font_file(path: str):
+    if path not in _font_files:
+        with open(path, 'rb') as file:
+            _font_files[path] = file.read()
+
+    return _font_files[path]
+
+
+def get_font(
+        font_or_font_size: FontType | int | str = DEFAULT_FONT_SIZE,
+        font_size: int = ...,
+        bold=False,
+        italic=False,
+        underline=False
+):
+    """
+    Getting the font from `font_cache`, the font file is read from the disk only once for all the sizes and styles.
+    ATTENTION: the font is shared, so it is `CachedFont`, whose size and style can not be changed
+    :param font_or_font_size: font, that is returned as is, or the size of the default font, or the font file path
+    :param font_size: the size of the font, only together with the font file path
+    :param bold: if true, then the font is bold
+    :param italic: if true, then the font is italic
+    :param underline: if true, then the font is underlined
+    """
     if not get_init():
         init()
 
@@ -31,17 +99,50 @@ def get_font(font_or_font_size: FontType | int | str = DEFAULT_FONT_SIZE, font_s
         raise ValueError()
 
     if isinstance(font_or_font_size, int):
-        font_or_font_size = max(font_or_font_size, 1)
-
-        if font_or_font_size not in _font_buffer:
-            _font_buffer[font_or_font_size] = Font(DEFAULT_FONT_NAME, font_or_font_size)
-
-        return _font_buffer[font_or_font_size]
-
-    if isinstance(font_or_font_size, str):
-        return Font(font_or_font_size, font_size)
-
-    return font_or_font_size
+        font_path, font_size = DEFAULT_FONT_NAME, max(font_or_font_size, 1)
+    elif isinstance(font_or_font_size, str):
+        font_path, font_size = font_or_font_size, DEFAULT_FONT_SIZE if font_size is ... else max(font_size, 1)
+    else:
+        return font_or_font_size
+
+    key = font_path, font_size, bold, italic, underline
+    font = font_cache.get(key)
+
+    if font is None:
+        # ATTENTION: every font needs its own file object, because the font reads the file lazily, but the bytes
+        # of the file are shared
+        font = CachedFont(BytesIO(_get_font_file(font_path)), font_size, bold, italic, underline)
+
+        font_cache.put(key, font)
+
+    return font
+
+
+def preload_fonts(
+        font_paths: Sequence[str] = (DEFAULT_FONT_NAME,),
+        font_sizes: Sequence[int] = (DEFAULT_FONT_SIZE,),
+        bold=False,
+        italic=False,
+        underline=False
+):
+    """
+    Loading the font files and putting the fonts of all the sizes into `font_cache`, for example, at startup.
+    ATTENTION: the fonts are shared `CachedFont`, whose size and style can not be changed
+    :param font_paths: the font file paths
+    :param font_sizes: the sizes of the fonts
+    :param bold: if true, then the fonts are bold
+    :param italic: if true, then the fonts are italic
+    :param underline: if true, then the fonts are underlined
+    """
+    for font_path in font_paths:
+        for font_size in font_sizes:
+            get_font(font_path, font_size, bold, italic, underline)
+
+
+def clear_font_cache():
+    """Removing all the fonts and the loaded font files"""
+    font_cache.clear()
+    _font_files.clear()
 
 
 __all__ = (
@@ -56,5 +157,10 @@ __all__ = (
     'FONT_NOTO_SANS_SC_REGULAR',
     'DEFAULT_FONT_NAME',
     'DEFAULT_FONT_SIZE',
+    'FONT_CACHE_MAX_SIZE',
+    'CachedFont',
+    'font_cache',
     'get_font',
+    'preload_fonts',
+    'clear_font_cache',
 )
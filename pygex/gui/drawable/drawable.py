@@ -1,6 +1,6 @@
 from pygex.color import TYPE_COLOR, COLOR_TRANSPARENT
 from pygex.surface import AlphaSurface, TYPE_SURFACE
-from pygex.transform import gradient, round_corners
+from pygex.transform import GRADIENT_TYPE_LINEAR, gradient, round_corners
 from pygex.draw import rect as draw_rect
 from typing import Sequence
 
@@ -130,15 +130,31 @@ class GradientDrawable(Drawable):
             is_vertical=False,
             border_radius_or_radii: int | Sequence[int] = 0,
             border_width: int = 0,
-            border_color: TYPE_COLOR = COLOR_TRANSPARENT
+            border_color: TYPE_COLOR = COLOR_TRANSPARENT,
+            positions: Sequence[float] = ...,
+            angle: float = ...,
+            gradient_type=GRADIENT_TYPE_LINEAR,
+            dithering=False
     ):
         super().__init__(border_radius_or_radii, border_width, border_color)
 
         self.colors = colors
         self.is_vertical = is_vertical
+        self.positions = positions
+        self.angle = angle
+        self.gradient_type = gradient_type
+        self.dithering = dithering
 
     def render(self, size: Sequence[int]) -> TYPE_SURFACE:
-        output_surface = gradient(size, self.colors, self.is_vertical)
+        output_surface = gradient(
+            size,
+            self.colors,
+            self.is_vertical,
+            self.positions,
+            self.angle,
+            self.gradient_type,
+            self.dithering
+        )
 
         if self.has_border_radii:
             output_surface = round_corners(
@@ -24,7 +24,9 @@ class TextView(View):
             font_or_font_size: TYPE_FONT = DEFAULT_FONT_SIZE,
             background_drawable_or_color: Drawable | TYPE_COLOR = COLOR_TRANSPARENT,
             font_antialiasing=True,
-            prerender_during_initialization=True
+            prerender_during_initialization=True,
+            use_glyph_atlas=False,
+            viewport_mode=False
     ):
         super().__init__(
             size,
@@ -48,7 +50,9 @@ class TextView(View):
             text_line_spacing,
             text_lines_number,
             text_paragraph_space,
-            font_antialiasing
+            font_antialiasing,
+            use_glyph_atlas=use_glyph_atlas,
+            viewport_mode=viewport_mode
         )
 
         if prerender_during_initialization:
@@ -75,6 +79,14 @@ class TextView(View):
 
         self.render_background_surface()
 
+    def set_scroll_offset(self, scroll_offset: float | int):
+        """Scrolling the text, if the view is in the viewport mode"""
+        if self.text_renderer.set_scroll_offset(scroll_offset) and isinstance(self._parent, View):
+            self._parent.render_content_surface()
+
+    def get_scroll_offset(self):
+        return self.text_renderer.get_scroll_offset()
+
     @property
     def buffered_content_surface(self) -> TYPE_SURFACE | None:
         return self.text_renderer.text_surface
@@ -1,48 +1,700 @@
+from math import comb, hypot, sqrt, isclose, floor, inf
+from itertools import accumulate
+from functools import lru_cache
+from bisect import bisect_right
 from typing import Sequence
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_NUMPY_IS_REQUIRED_MESSAGE = 'For using %s needs to install numpy module first: `pip install numpy`'
+
+DEFAULT_FLATNESS_TOLERANCE = 0.5
+MAX_SUBDIVISION_DEPTH = 16
+
+
+@lru_cache(maxsize=64)
+def _get_bernstein_basis(degree: int, density: int):
+    """
+    Bernstein basis matrix with the shape `(density, degree + 1)`, the row `i` of which contains the weights
+    of all vertexes for `t = i / density`. The matrix is cached, since the same curve degree and density are usually
+    requested by the same consumer over and over again
+    """
+    t = np.arange(density, dtype=np.float64) / density
+    k = np.arange(degree + 1)
+
+    basis = np.array([comb(degree, i) for i in range(degree + 1)], dtype=np.float64) \
+        * t[:, None] ** k * (1 - t[:, None]) ** (degree - k)
+    basis.setflags(write=False)
+
+    return basis
+
+
+def _generate_curve_points(vertexes: Sequence[Sequence[float | int]], density: int):
+    """De Casteljau algorithm, used when `numpy` is not installed"""
+    points = []
+
+    for i in range(density):
+        t = i / density
+        prepoints = [(vertex[0], vertex[1]) for vertex in vertexes]
+
+        while len(prepoints) > 1:
+            prepoints = [
+                (
+                    prepoints[k][0] * (1 - t) + prepoints[k + 1][0] * t,
+                    prepoints[k][1] * (1 - t) + prepoints[k + 1][1] * t
+                ) for k in range(len(prepoints) - 1)
+            ]
+
+        points.append(prepoints[0])
+
+    return points
+
 
 def generate_curve(
         vertexes: Sequence[Sequence[float | int]],
         density: int,
-        fixed_ends=False
-) -> tuple | tuple[Sequence[float | int]]:
+        fixed_ends=False,
+        as_array=False
+):
     """
     Fast Bézier curve generating
     :param vertexes: the vertexes on the basis of which the curve will be generated
     :param density: the number of segments that the curve will consist of
     :param fixed_ends: if true, then the beginning and end of the curve will be the same where it was at the specified
     vertices
+    :param as_array: if true, then the points are returned as a contiguous `numpy` array of floats with the shape
+    `(points_number, 2)` instead of a tuple of points (requires `numpy`)
     """
+    if as_array and np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`as_array`')
 
     if len(vertexes) <= 2:
-        return *vertexes,
+        return np.array(vertexes, dtype=np.float64).reshape(-1, 2) if as_array else (*vertexes,)
 
-    points = ()
+    if np is None:
+        points = _generate_curve_points(vertexes, density)
+    else:
+        points = _get_bernstein_basis(len(vertexes) - 1, density) @ np.asarray(vertexes, dtype=np.float64)
 
-    for i in range(density):
-        t = i / density
-        prepoints = *vertexes,
+        if not as_array:
+            points = [*map(tuple, points.tolist())]
 
-        while len(prepoints) > 1:
-            new_prepoints = ()
+    if fixed_ends:
+        first_vertex, last_vertex = (*vertexes[0],), (*vertexes[-1],)
+        is_empty = len(points) == 0
 
-            for k in range(len(prepoints) - 1):
-                new_prepoints = *new_prepoints, tuple(
-                    prepoints[k][j] * (1 - t) + prepoints[k + 1][j] * t for j in range(2)
-                )
+        if as_array:
+            if is_empty or (*points[0],) != first_vertex:
+                points = np.concatenate((np.array([first_vertex], dtype=np.float64), points))
 
-            prepoints = new_prepoints
+            if is_empty or (*points[-1],) != last_vertex:
+                points = np.concatenate((points, np.array([last_vertex], dtype=np.float64)))
+        else:
+            if is_empty or points[0] != first_vertex:
+                points.insert(0, first_vertex)
 
-        points = *points, *prepoints
+            if is_empty or points[-1] != last_vertex:
+                points.append(last_vertex)
 
-    if fixed_ends:
-        if points[0] != vertexes[0]:
-            points = vertexes[0], *points
+    return points if as_array else (*points,)
 
-        if points[-1] != vertexes[-1]:
-            points = *points, vertexes[-1]
 
-    return points
+def generate_curves(
+        vertexes_sequence: Sequence[Sequence[Sequence[float | int]]],
+        density: int,
+        fixed_ends=False
+):
+    """
+    Batch Bézier curves generating (requires `numpy`). All the curves with the same number of vertexes are evaluated
+    in a single vectorized pass and written into one packed buffer
+    :param vertexes_sequence: the sequence of vertexes of every curve
+    :param density: the number of segments that every curve will consist of
+    :param fixed_ends: if true, then the beginning and end of every curve will be the same where it was at its first
+    and last vertexes, as in `generate_curve`
+    :return: the packed points as a contiguous array of floats with the shape `(points_number, 2)` and the offsets
+    array, so points of the curve `i` are `points[offsets[i]:offsets[i + 1]]`
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`generate_curves`')
+
+    density = max(density, 0)
+    vertexes_sequence = [np.asarray(vertexes, dtype=np.float64).reshape(-1, 2) for vertexes in vertexes_sequence]
+    points_numbers = np.array([len(vertexes) for vertexes in vertexes_sequence], dtype=np.int64)
+    has_first_vertex = np.zeros(len(vertexes_sequence), dtype=bool)
+    has_last_vertex = np.zeros(len(vertexes_sequence), dtype=bool)
+    curve_indexes_by_vertexes_number = {}
+
+    for curve_index, vertexes in enumerate(vertexes_sequence):
+        if len(vertexes) > 2:
+            curve_indexes_by_vertexes_number.setdefault(len(vertexes), []).append(curve_index)
+
+    curves_groups = []
+
+    for vertexes_number, curve_indexes in curve_indexes_by_vertexes_number.items():
+        curve_indexes = np.array(curve_indexes, dtype=np.int64)
+        curves_vertexes = np.stack([vertexes_sequence[curve_index] for curve_index in curve_indexes])
+        curves_points = _get_bernstein_basis(vertexes_number - 1, density) @ curves_vertexes
+
+        # ATTENTION: as in `generate_curve`, the end vertex is added only if the curve does not end at it already
+        if fixed_ends:
+            has_first_vertex[curve_indexes] = density == 0 or (curves_points[:, 0] != curves_vertexes[:, 0]).any(1)
+            has_last_vertex[curve_indexes] = density == 0 or (curves_points[:, -1] != curves_vertexes[:, -1]).any(1)
+
+        points_numbers[curve_indexes] = density + has_first_vertex[curve_indexes] + has_last_vertex[curve_indexes]
+        curves_groups.append((curve_indexes, curves_vertexes, curves_points))
+
+    offsets = np.zeros(len(vertexes_sequence) + 1, dtype=np.int64)
+    np.cumsum(points_numbers, out=offsets[1:])
+
+    points = np.empty((offsets[-1], 2), dtype=np.float64)
+
+    for curve_index, vertexes in enumerate(vertexes_sequence):
+        if len(vertexes) <= 2:
+            points[offsets[curve_index]:offsets[curve_index + 1]] = vertexes
+
+    for curve_indexes, curves_vertexes, curves_points in curves_groups:
+        curves_has_first_vertex = has_first_vertex[curve_indexes]
+        curves_has_last_vertex = has_last_vertex[curve_indexes]
+
+        point_indexes = (offsets[curve_indexes] + curves_has_first_vertex)[:, None] + np.arange(density)
+        points[point_indexes] = curves_points
+
+        points[offsets[curve_indexes[curves_has_first_vertex]]] = curves_vertexes[curves_has_first_vertex, 0]
+        points[offsets[curve_indexes[curves_has_last_vertex] + 1] - 1] = curves_vertexes[curves_has_last_vertex, -1]
+
+    return points, offsets
+
+
+def _split_curve(vertexes: Sequence[tuple[float, float]]):
+    """Splitting the curve into two halves by de Casteljau algorithm"""
+    left_vertexes, right_vertexes = [vertexes[0]], [vertexes[-1]]
+
+    while len(vertexes) > 1:
+        vertexes = [
+            ((vertexes[k][0] + vertexes[k + 1][0]) / 2, (vertexes[k][1] + vertexes[k + 1][1]) / 2)
+            for k in range(len(vertexes) - 1)
+        ]
+        left_vertexes.append(vertexes[0])
+        right_vertexes.append(vertexes[-1])
+
+    return left_vertexes, right_vertexes[::-1]
+
+
+def _get_distance_to_segment(
+        point: Sequence[float | int],
+        segment_start: Sequence[float | int],
+        segment_end: Sequence[float | int]
+):
+    (x, y), (x0, y0), (x1, y1) = point, segment_start, segment_end
+    dx, dy = x1 - x0, y1 - y0
+    segment_length_sqr = dx * dx + dy * dy
+    t = 0 if segment_length_sqr == 0 else min(max(((x - x0) * dx + (y - y0) * dy) / segment_length_sqr, 0), 1)
+
+    return hypot(x - x0 - dx * t, y - y0 - dy * t)
+
+
+def _get_flatness(vertexes: Sequence[tuple[float, float]]):
+    """
+    The maximum distance from the inner vertexes to the chord of the curve. Since the curve lies inside the convex hull
+    of its vertexes, the curve never deviates from the chord more than this value
+    """
+    return max(_get_distance_to_segment(vertex, vertexes[0], vertexes[-1]) for vertex in vertexes[1:-1])
+
+
+def flatten_curve(
+        vertexes: Sequence[Sequence[float | int]],
+        tolerance: float = DEFAULT_FLATNESS_TOLERANCE,
+        as_array=False
+):
+    """
+    Adaptive Bézier curve generating. The curve is subdivided recursively only where it is needed, so nearly straight
+    pieces consist of a few points, and tight bends consist of as many points as needed to look smooth
+    :param vertexes: the vertexes on the basis of which the curve will be generated
+    :param tolerance: the maximum distance in pixels between the curve and the resulting polyline
+    :param as_array: if true, then the points are returned as a contiguous `numpy` array of floats with the shape
+    `(points_number, 2)` instead of a tuple of points (requires `numpy`)
+    """
+    if tolerance <= 0:
+        raise ValueError('Flatness tolerance must be greater than 0')
+
+    if as_array and np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`as_array`')
+
+    if len(vertexes) <= 2:
+        return np.array(vertexes, dtype=np.float64).reshape(-1, 2) if as_array else (*vertexes,)
+
+    vertexes = [(vertex[0], vertex[1]) for vertex in vertexes]
+    points = [vertexes[0]]
+    subcurves_stack = [(vertexes, 0)]
+
+    while subcurves_stack:
+        subcurve_vertexes, depth = subcurves_stack.pop()
+
+        if depth >= MAX_SUBDIVISION_DEPTH or _get_flatness(subcurve_vertexes) <= tolerance:
+            points.append(subcurve_vertexes[-1])
+            continue
+
+        left_vertexes, right_vertexes = _split_curve(subcurve_vertexes)
+
+        subcurves_stack.append((right_vertexes, depth + 1))
+        subcurves_stack.append((left_vertexes, depth + 1))
+
+    return np.array(points, dtype=np.float64) if as_array else (*points,)
+
+
+def _evaluate_curve(vertexes: Sequence[Sequence[float | int]], t: float):
+    prepoints = [(vertex[0], vertex[1]) for vertex in vertexes]
+
+    while len(prepoints) > 1:
+        prepoints = [
+            (
+                prepoints[k][0] * (1 - t) + prepoints[k + 1][0] * t,
+                prepoints[k][1] * (1 - t) + prepoints[k + 1][1] * t
+            ) for k in range(len(prepoints) - 1)
+        ]
+
+    return prepoints[0]
+
+
+def _find_polynomial_roots(coefficients: Sequence[float]):
+    """
+    Roots in the interval (0, 1) of the polynomial `coefficients[0] + coefficients[1] * t + ...`. Up to quadratic
+    polynomials roots are found analytically, higher degrees are sampled for sign changes and refined by bisection
+    """
+    while coefficients and isclose(coefficients[-1], 0, abs_tol=1e-12):
+        coefficients = coefficients[:-1]
+
+    degree = len(coefficients) - 1
+
+    if degree <= 0:
+        return ()
+
+    if degree == 1:
+        roots = -coefficients[0] / coefficients[1],
+    elif degree == 2:
+        c, b, a = coefficients
+        discriminant = b * b - 4 * a * c
+
+        if discriminant < 0:
+            return ()
+
+        roots = (-b - sqrt(discriminant)) / (2 * a), (-b + sqrt(discriminant)) / (2 * a)
+    else:
+        def polynomial(t: float):
+            value = 0
+
+            for coefficient in reversed(coefficients):
+                value = value * t + coefficient
+
+            return value
+
+        samples_number = degree * 8
+        roots = []
+
+        for i in range(samples_number):
+            t0, t1 = i / samples_number, (i + 1) / samples_number
+            value0, value1 = polynomial(t0), polynomial(t1)
+
+            if value0 == 0:
+                roots.append(t0)
+                continue
+
+            if value0 * value1 > 0:
+                continue
+
+            for _ in range(48):
+                middle_t = (t0 + t1) / 2
+
+                if value0 * polynomial(middle_t) <= 0:
+                    t1 = middle_t
+                else:
+                    t0, value0 = middle_t, polynomial(middle_t)
+
+            roots.append((t0 + t1) / 2)
+
+    return tuple(root for root in roots if 0 < root < 1)
+
+
+def _get_derivative_extrema(vertexes: Sequence[Sequence[float | int]]):
+    """Parameters `t` in which the derivative of the curve by x or by y is equal to zero"""
+    degree = len(vertexes) - 1
+    extrema = []
+
+    for axis in range(2):
+        # the derivative of a Bézier curve is a Bézier curve of lower degree, which is converted to the power basis
+        derivative = [degree * (vertexes[i + 1][axis] - vertexes[i][axis]) for i in range(degree)]
+        coefficients = [
+            comb(degree - 1, j) * sum((-1) ** (j - i) * comb(j, i) * derivative[i] for i in range(j + 1))
+            for j in range(degree)
+        ]
+
+        extrema.extend(_find_polynomial_roots(coefficients))
+
+    return extrema
+
+
+def _get_curve_vertexes(vertexes: Sequence[Sequence[float | int]]):
+    vertexes = [(vertex[0], vertex[1]) for vertex in vertexes]
+
+    # ATTENTION: the polyline of the curve without vertexes has no points, so there is no point at any distance
+    if not vertexes:
+        raise ValueError('Curve must have at least one vertex')
+
+    return vertexes
+
+
+class Curve:
+    """
+    Bézier curve, which caches the things that are expensive to compute: its flattened polyline, its bounding rect and
+    its arc-length table. The caches are dropped and the `version` is increased every time the curve is changed
+    """
+
+    def __init__(
+            self,
+            vertexes: Sequence[Sequence[float | int]],
+            density: int = ...,
+            tolerance: float = DEFAULT_FLATNESS_TOLERANCE
+    ):
+        """
+        :param vertexes: the vertexes on the basis of which the curve will be generated, at least one
+        :param density: the number of segments that the polyline will consist of, if not specified, then the polyline
+        is generated adaptively by `tolerance`
+        :param tolerance: the maximum distance in pixels between the curve and the polyline
+        """
+        self._vertexes = _get_curve_vertexes(vertexes)
+        self._density = density
+        self._tolerance = tolerance
+        self._version = 0
+
+        self._polyline: tuple[tuple[float, float], ...] | None = None
+        self._bounding_rect: tuple[float, float, float, float] | None = None
+        self._arc_lengths: list[float] | None = None
+
+    def _invalidate(self):
+        self._version += 1
+        self._polyline = self._bounding_rect = self._arc_lengths = None
+
+    @property
+    def version(self):
+        """The number that is increased every time the curve is changed"""
+        return self._version
+
+    def set_vertexes(self, vertexes: Sequence[Sequence[float | int]]):
+        vertexes = _get_curve_vertexes(vertexes)
+
+        if vertexes != self._vertexes:
+            self._vertexes = vertexes
+            self._invalidate()
+
+    def get_vertexes(self):
+        return (*self._vertexes,)
+
+    def set_vertex(self, index: int, vertex: Sequence[float | int]):
+        vertex = vertex[0], vertex[1]
+
+        if vertex != self._vertexes[index]:
+            self._vertexes[index] = vertex
+            self._invalidate()
+
+    def get_vertex(self, index: int):
+        return self._vertexes[index]
+
+    def set_density(self, density: int):
+        if density != self._density:
+            self._density = density
+            self._invalidate()
+
+    def get_density(self):
+        return self._density
+
+    def set_tolerance(self, tolerance: float):
+        if tolerance != self._tolerance:
+            self._tolerance = tolerance
+            self._invalidate()
+
+    def get_tolerance(self):
+        return self._tolerance
+
+    @property
+    def polyline(self) -> tuple[tuple[float, float], ...]:
+        if self._polyline is None:
+            if self._density is ...:
+                self._polyline = flatten_curve(self._vertexes, self._tolerance)
+            else:
+                self._polyline = generate_curve(self._vertexes, self._density, fixed_ends=True)
+
+        return self._polyline
+
+    @property
+    def bounding_rect(self) -> tuple[float, float, float, float]:
+        """Exact bounds of the curve (not of its polyline) as `(x, y, width, height)`"""
+        if self._bounding_rect is None:
+            points = [self._vertexes[0], self._vertexes[-1]] + [
+                _evaluate_curve(self._vertexes, t) for t in _get_derivative_extrema(self._vertexes)
+            ]
+
+            min_x, min_y = min(point[0] for point in points), min(point[1] for point in points)
+            max_x, max_y = max(point[0] for point in points), max(point[1] for point in points)
+
+            self._bounding_rect = min_x, min_y, max_x - min_x, max_y - min_y
+
+        return self._bounding_rect
+
+    def _get_arc_lengths(self):
+        if self._arc_lengths is None:
+            polyline = self.polyline
+            self._arc_lengths = [*accumulate(
+                (
+                    hypot(polyline[i + 1][0] - polyline[i][0], polyline[i + 1][1] - polyline[i][1])
+                    for i in range(len(polyline) - 1)
+                ),
+                initial=0
+            )]
+
+        return self._arc_lengths
+
+    @property
+    def length(self) -> float:
+        return self._get_arc_lengths()[-1]
+
+    def get_point_at_distance(self, distance: float) -> tuple[float, float]:
+        """
+        Getting the point of the polyline located at the specified distance along the curve from its beginning
+        :param distance: the distance, which is clamped to the curve length
+        """
+        polyline = self.polyline
+        arc_lengths = self._get_arc_lengths()
+
+        if len(polyline) == 1 or distance <= 0:
+            return polyline[0]
+
+        if distance >= arc_lengths[-1]:
+            return polyline[-1]
+
+        segment_index = bisect_right(arc_lengths, distance) - 1
+        segment_length = arc_lengths[segment_index + 1] - arc_lengths[segment_index]
+        t = 0 if segment_length == 0 else (distance - arc_lengths[segment_index]) / segment_length
+        (x0, y0), (x1, y1) = polyline[segment_index], polyline[segment_index + 1]
+
+        return x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+
+    def get_evenly_spaced_points(self, spacing: float, offset: float = 0) -> tuple[tuple[float, float], ...]:
+        """
+        Getting the points located at the same distance from each other along the curve (for brushes and dashes)
+        :param spacing: the distance between the neighboring points
+        :param offset: the distance along the curve of the first point
+        """
+        if spacing <= 0:
+            raise ValueError('Spacing must be greater than 0')
+
+        points_number = int((self.length - offset) // spacing) + 1 if self.length >= offset else 0
+
+        return tuple(self.get_point_at_distance(offset + i * spacing) for i in range(points_number))
+
+
+class CurveSpatialIndex:
+    """
+    Uniform grid over the segments of curve polylines for fast hit-testing. Every curve is stored under its own key,
+    and can be replaced or removed without rebuilding the whole index
+    """
+
+    def __init__(self, cell_size: float | int = 64):
+        """
+        :param cell_size: the size of the grid cell, the best value is a few times larger than the typical segment
+        length and the typical query radius
+        """
+        if cell_size <= 0:
+            raise ValueError('Cell size must be greater than 0')
+
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[object, list[int]]] = {}
+        self._polylines: dict[object, Sequence[Sequence[float | int]]] = {}
+        self._curve_cells: dict[object, list[tuple[int, int]]] = {}
+        self._curves: dict[object, Curve] = {}
+        self._curve_versions: dict[object, int] = {}
+
+        # ATTENTION: the bounds of occupied cells are only expanded, so they are used just to stop the nearest segment
+        # searching, when the whole occupied area has been checked
+        self._cells_bounds: list[int] | None = None
+
+    def __len__(self):
+        return len(self._polylines)
+
+    def __contains__(self, key):
+        return key in self._polylines
+
+    def get_cell_size(self):
+        return self._cell_size
+
+    def _get_cell(self, point: Sequence[float | int]):
+        return floor(point[0] / self._cell_size), floor(point[1] / self._cell_size)
+
+    def set_curve(self, key, curve_or_polyline: Curve | Sequence[Sequence[float | int]]):
+        """
+        Adding the curve to the index or replacing the curve with the same key
+        :param key: any hashable value that will be returned by queries
+        :param curve_or_polyline: `Curve` (its changes are picked up by `refresh()`) or the sequence of points
+        """
+        self.remove_curve(key)
+
+        if isinstance(curve_or_polyline, Curve):
+            self._curves[key] = curve_or_polyline
+            self._curve_versions[key] = curve_or_polyline.version
+            polyline = curve_or_polyline.polyline
+        else:
+            polyline = curve_or_polyline
+
+        curve_cells = set()
+
+        for segment_index in range(len(polyline) - 1):
+            (x0, y0), (x1, y1) = polyline[segment_index], polyline[segment_index + 1]
+            min_cell_x, min_cell_y = self._get_cell((min(x0, x1), min(y0, y1)))
+            max_cell_x, max_cell_y = self._get_cell((max(x0, x1), max(y0, y1)))
+
+            for cell_x in range(min_cell_x, max_cell_x + 1):
+                for cell_y in range(min_cell_y, max_cell_y + 1):
+                    self._cells.setdefault((cell_x, cell_y), {}).setdefault(key, []).append(segment_index)
+                    curve_cells.add((cell_x, cell_y))
+
+        if curve_cells:
+            min_cell_x, min_cell_y = min(cell[0] for cell in curve_cells), min(cell[1] for cell in curve_cells)
+            max_cell_x, max_cell_y = max(cell[0] for cell in curve_cells), max(cell[1] for cell in curve_cells)
+
+            if self._cells_bounds is None:
+                self._cells_bounds = [min_cell_x, min_cell_y, max_cell_x, max_cell_y]
+            else:
+                self._cells_bounds = [
+                    min(self._cells_bounds[0], min_cell_x),
+                    min(self._cells_bounds[1], min_cell_y),
+                    max(self._cells_bounds[2], max_cell_x),
+                    max(self._cells_bounds[3], max_cell_y)
+                ]
+
+        self._polylines[key] = polyline
+        self._curve_cells[key] = [*curve_cells]
+
+    def remove_curve(self, key):
+        if key not in self._polylines:
+            return
+
+        for cell in self._curve_cells.pop(key):
+            cell_content = self._cells[cell]
+            del cell_content[key]
+
+            if not cell_content:
+                del self._cells[cell]
+
+        del self._polylines[key]
+        self._curves.pop(key, None)
+        self._curve_versions.pop(key, None)
+
+        if not self._polylines:
+            self._cells_bounds = None
+
+    def clear(self):
+        self._cells.clear()
+        self._polylines.clear()
+        self._curve_cells.clear()
+        self._curves.clear()
+        self._curve_versions.clear()
+        self._cells_bounds = None
+
+    def refresh(self):
+        """Reindexing only those `Curve` objects that have been changed since they were indexed"""
+        for key, curve in [*self._curves.items()]:
+            if curve.version != self._curve_versions[key]:
+                self.set_curve(key, curve)
+
+    def _get_segment_distance(self, key, segment_index: int, point: Sequence[float | int]):
+        polyline = self._polylines[key]
+
+        return _get_distance_to_segment(point, polyline[segment_index], polyline[segment_index + 1])
+
+    def query_radius(self, point: Sequence[float | int], radius: float | int) -> list[tuple[object, int, float]]:
+        """
+        Getting all the segments located within the radius from the point
+        :return: the list of `(key, segment_index, distance)` sorted by distance
+        """
+        min_cell_x, min_cell_y = self._get_cell((point[0] - radius, point[1] - radius))
+        max_cell_x, max_cell_y = self._get_cell((point[0] + radius, point[1] + radius))
+
+        checked_segments = set()
+        found_segments = []
+
+        for cell_x in range(min_cell_x, max_cell_x + 1):
+            for cell_y in range(min_cell_y, max_cell_y + 1):
+                for key, segment_indexes in self._cells.get((cell_x, cell_y), {}).items():
+                    for segment_index in segment_indexes:
+                        if (key, segment_index) in checked_segments:
+                            continue
+
+                        checked_segments.add((key, segment_index))
+                        distance = self._get_segment_distance(key, segment_index, point)
+
+                        if distance <= radius:
+                            found_segments.append((key, segment_index, distance))
+
+        return sorted(found_segments, key=lambda found_segment: found_segment[2])
+
+    def query_nearest(
+            self,
+            point: Sequence[float | int],
+            max_distance: float | int = inf
+    ) -> tuple[object, int, float] | None:
+        """
+        Getting the segment nearest to the point by checking grid cells ring by ring around the point
+        :return: `(key, segment_index, distance)` or None if there is no segment within `max_distance`
+        """
+        if self._cells_bounds is None:
+            return
+
+        center_cell_x, center_cell_y = self._get_cell(point)
+        max_ring = max(
+            center_cell_x - self._cells_bounds[0],
+            center_cell_y - self._cells_bounds[1],
+            self._cells_bounds[2] - center_cell_x,
+            self._cells_bounds[3] - center_cell_y
+        )
+
+        if max_distance != inf:
+            max_ring = min(max_ring, int(max_distance // self._cell_size) + 1)
+
+        checked_segments = set()
+        nearest_segment = None
+
+        for ring in range(max_ring + 1):
+            for cell_x in range(center_cell_x - ring, center_cell_x + ring + 1):
+                # the inner cells of the ring columns have already been checked by the previous rings
+                cell_y_step = 1 if cell_x in (center_cell_x - ring, center_cell_x + ring) else ring * 2
+
+                for cell_y in range(center_cell_y - ring, center_cell_y + ring + 1, cell_y_step):
+                    for key, segment_indexes in self._cells.get((cell_x, cell_y), {}).items():
+                        for segment_index in segment_indexes:
+                            if (key, segment_index) in checked_segments:
+                                continue
+
+                            checked_segments.add((key, segment_index))
+                            distance = self._get_segment_distance(key, segment_index, point)
+
+                            if distance <= max_distance and (nearest_segment is None or distance < nearest_segment[2]):
+                                nearest_segment = key, segment_index, distance
+
+            # ATTENTION: all the segments outside the checked rings are at least `ring * cell_size` away from the point
+            if nearest_segment is not None and nearest_segment[2] <= ring * self._cell_size:
+                break
+
+        return nearest_segment
 
 
-__all__ = 'generate_curve',
+__all__ = (
+    'DEFAULT_FLATNESS_TOLERANCE',
+    'MAX_SUBDIVISION_DEPTH',
+    'generate_curve',
+    'generate_curves',
+    'flatten_curve',
+    'Curve',
+    'CurveSpatialIndex'
+)
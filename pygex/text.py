@@ -1,6 +1,11 @@
-from pygex.font import TYPE_FONT, DEFAULT_FONT_SIZE, get_font
+from pygex.font import TYPE_FONT, DEFAULT_FONT_SIZE, FONT_CACHE_MAX_SIZE, get_font
 from pygex.surface import AlphaSurface, TYPE_SURFACE
 from pygex.color import TYPE_COLOR, as_rgba
+from itertools import accumulate
+from pygame.font import FontType
+from pygex.cache import LRUCache
+from bisect import bisect_left, bisect_right
+from pygame.rect import Rect
 from typing import Sequence
 
 ALIGN_LEFT = 0
@@ -10,6 +15,276 @@ ALIGN_BLOCK = 3
 
 SIZE_WRAP_CONTENT = -2
 
+GLYPH_ATLAS_INITIAL_SIZE = 256
+GLYPH_ATLAS_MAX_SIZE = 2048
+GLYPH_ATLAS_PADDING = 1
+
+TEXT_SURFACE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+
+text_surface_cache = LRUCache(
+    TEXT_SURFACE_CACHE_MAX_BYTES,
+    lambda surface: surface.get_width() * surface.get_height() * surface.get_bytesize()
+)
+"""
+The cache of Surfaces rendered by `render_text` keyed by the text, color, font, antialiasing and glyph atlas usage.
+It is bounded by `TEXT_SURFACE_CACHE_MAX_BYTES` of pixels, the statistics are available by `info` and `hit_rate`
+"""
+
+
+class GlyphAtlas:
+    """
+    The Surface into which every glyph (of a font, color and antialiasing) is rendered only once, so the text is
+    composed by one `Surface.fblits` call instead of rendering it by the font. The glyphs are packed into shelves,
+    and when there is no space, the atlas grows up to `max_size`, after which the least recently used shelf is evicted.
+    ATTENTION: the glyphs are rendered separately, so the kerning and the contextual alternates (ligatures) of the font
+    are not applied. Only if the glyphs of one text do not fit into the atlas of `max_size`, the whole atlas is cleared
+    """
+
+    def __init__(self, initial_size: int = GLYPH_ATLAS_INITIAL_SIZE, max_size: int = GLYPH_ATLAS_MAX_SIZE):
+        """
+        :param initial_size: the width and height of the atlas Surface at the start
+        :param max_size: the maximum width and height of the atlas Surface
+        """
+        self._initial_size = initial_size
+        self._max_size = max(max_size, initial_size)
+
+        self.surface = AlphaSurface((initial_size, initial_size))
+        self._glyphs: dict[tuple, tuple[TYPE_SURFACE, int]] = {}
+        self._glyph_shelves: dict[tuple, list] = {}
+
+        # each shelf is [y, height, x of the free space, the use number of the last use, the keys of the glyphs]
+        self._shelves: list[list] = []
+        self._use_number = 0
+
+        self.hits = self.misses = self.evictions = self.clears = 0
+
+    def __len__(self):
+        return len(self._glyphs)
+
+    def clear(self):
+        self.surface = AlphaSurface((self._initial_size, self._initial_size))
+        self._glyphs.clear()
+        self._glyph_shelves.clear()
+        self._shelves.clear()
+        self.clears += 1
+
+    def get_glyph(self, font: FontType, char: str, color: Sequence[int], antialiasing=True) -> tuple[TYPE_SURFACE, int]:
+        """
+        Getting the glyph, that is the subsurface of the atlas Surface, the glyph is rendered if it is not on the atlas
+        yet. ATTENTION: the glyph is valid only until the next change of the atlas, that evicts or moves it
+        :return: the subsurface and the advance width of the glyph
+        """
+        key = font, char, color, antialiasing
+        glyph = self._glyphs.get(key)
+
+        if glyph is not None:
+            self._glyph_shelves[key][3] = self._use_number
+            self.hits += 1
+            return glyph
+
+        self.misses += 1
+
+        glyph_surface = font.render(char, antialiasing, color)
+        shelf_and_area = self._allocate(*glyph_surface.get_size())
+
+        if shelf_and_area is None:
+            self.clear()
+            shelf_and_area = self._allocate(*glyph_surface.get_size())
+
+        shelf, area = shelf_and_area
+
+        self.surface.fill((0, 0, 0, 0), area)
+        self.surface.blit(glyph_surface, area)
+
+        glyph = self._glyphs[key] = self.surface.subsurface(area), glyph_surface.get_width()
+        self._glyph_shelves[key] = shelf
+        shelf[3] = self._use_number
+        shelf[4].append(key)
+
+        return glyph
+
+    def _allocate(self, width: int, height: int):
+        padded_width, padded_height = width + GLYPH_ATLAS_PADDING, height + GLYPH_ATLAS_PADDING
+
+        if padded_width > self._max_size or padded_height > self._max_size:
+            raise ValueError(f'The glyph of size {width}x{height} does not fit into the glyph atlas')
+
+        while True:
+            atlas_width, atlas_height = self.surface.get_size()
+
+            for shelf in self._shelves:
+                if shelf[1] >= padded_height and shelf[2] + padded_width <= atlas_width:
+                    shelf[2] += padded_width
+                    return shelf, Rect(shelf[2] - padded_width, shelf[0], width, height)
+
+            shelves_bottom = self._shelves[-1][0] + self._shelves[-1][1] if self._shelves else 0
+
+            if shelves_bottom + padded_height <= atlas_height and padded_width <= atlas_width:
+                shelf = [shelves_bottom, padded_height, padded_width, self._use_number, []]
+                self._shelves.append(shelf)
+                return shelf, Rect(0, shelves_bottom, width, height)
+
+            if not self._grow():
+                break
+
+        shelf = self._evict_shelf(padded_height)
+
+        if shelf is not None:
+            shelf[2] = padded_width
+            return shelf, Rect(0, shelf[0], width, height)
+
+    def _evict_shelf(self, padded_height: int):
+        # ATTENTION: the shelves used by the current text are not evicted, and if the least recently used shelf is too
+        # low, then it is merged with the next unused shelves
+        shelves = self._shelves
+
+        for first_index in sorted(range(len(shelves)), key=lambda index: shelves[index][3]):
+            if shelves[first_index][3] == self._use_number:
+                return
+
+            last_index, height = first_index, 0
+
+            while last_index < len(shelves) and shelves[last_index][3] != self._use_number and height < padded_height:
+                height += shelves[last_index][1]
+                last_index += 1
+
+            if height >= padded_height:
+                break
+        else:
+            return
+
+        for shelf in shelves[first_index:last_index]:
+            for key in shelf[4]:
+                del self._glyphs[key]
+                del self._glyph_shelves[key]
+
+        y = shelves[first_index][0]
+        use_number = shelves[last_index - 1][3]
+        shelf = [y, padded_height, 0, use_number, []]
+
+        # the rest of the evicted shelves stays free
+        shelves[first_index:last_index] = [shelf] if height == padded_height else [
+            shelf,
+            [y + padded_height, height - padded_height, 0, use_number, []]
+        ]
+
+        self.surface.fill((0, 0, 0, 0), (0, y, self.surface.get_width(), height))
+        self.evictions += 1
+
+        return shelf
+
+    def _grow(self):
+        atlas_width, atlas_height = self.surface.get_size()
+
+        if atlas_width >= self._max_size and atlas_height >= self._max_size:
+            return False
+
+        # ATTENTION: the height grows first, so the existing shelves just stay where they are
+        if atlas_height <= atlas_width and atlas_height < self._max_size:
+            new_size = atlas_width, min(atlas_height * 2, self._max_size)
+        else:
+            new_size = min(atlas_width * 2, self._max_size), atlas_height
+
+        new_surface = AlphaSurface(new_size)
+        new_surface.blit(self.surface, (0, 0))
+        self.surface = new_surface
+
+        # the glyphs are the subsurfaces of the old Surface, so they are moved to the new one
+        for key, (glyph_surface, advance) in self._glyphs.items():
+            self._glyphs[key] = new_surface.subsurface(glyph_surface.get_offset(), glyph_surface.get_size()), advance
+
+        return True
+
+    def get_glyphs(
+            self,
+            text: str,
+            font: FontType,
+            color: Sequence[int],
+            antialiasing=True
+    ) -> list[tuple[TYPE_SURFACE, int]]:
+        """:return: the subsurfaces and the advance widths of the glyphs of the text"""
+        # ATTENTION: the shelves used by the text are not evicted while its glyphs are collected, and if the atlas is
+        # grown or cleared, the collected glyphs keep the old Surface, so all the glyphs stay valid
+        self._use_number += 1
+
+        return [self.get_glyph(font, char, color, antialiasing) for char in text]
+
+    @staticmethod
+    def get_glyphs_blit_sequence(
+            glyphs: Sequence[tuple[TYPE_SURFACE, int]],
+            position: Sequence[float | int] = (0, 0)
+    ):
+        """
+        Getting the sequence for `Surface.fblits`, that draws the glyphs one after another from the position
+        :return: the blit sequence and the width of the glyphs
+        """
+        x, y = position
+        blit_sequence = []
+
+        for glyph_surface, advance in glyphs:
+            blit_sequence.append((glyph_surface, (x, y)))
+            x += advance
+
+        return blit_sequence, x - position[0]
+
+    def get_blit_sequence(
+            self,
+            text: str,
+            font: FontType,
+            color: Sequence[int],
+            antialiasing=True,
+            position: Sequence[float | int] = (0, 0)
+    ):
+        """
+        Getting the sequence for `Surface.fblits`, that draws the text at the position
+        :return: the blit sequence and the width of the text
+        """
+        return self.get_glyphs_blit_sequence(self.get_glyphs(text, font, color, antialiasing), position)
+
+    def blit_text(
+            self,
+            surface: TYPE_SURFACE,
+            text: str,
+            font: FontType,
+            color: Sequence[int],
+            antialiasing=True,
+            position: Sequence[float | int] = (0, 0)
+    ):
+        """Drawing the text onto the Surface by one `Surface.fblits` call without an intermediate Surface"""
+        blit_sequence, text_width = self.get_blit_sequence(text, font, color, antialiasing, position)
+        surface.fblits(blit_sequence)
+
+        return text_width
+
+    def render(self, text: str, font: FontType, color: Sequence[int], antialiasing=True) -> TYPE_SURFACE:
+        """The same as `Font.render`, but the text is composed from the atlas"""
+        blit_sequence, text_width = self.get_blit_sequence(text, font, color, antialiasing)
+        text_surface = AlphaSurface((text_width, font.get_height()))
+        text_surface.fblits(blit_sequence)
+
+        return text_surface
+
+
+_char_widths_cache = LRUCache(FONT_CACHE_MAX_SIZE)
+
+
+def _get_char_widths_prefix_sums(font: FontType, text: str, initial=0):
+    char_widths = _char_widths_cache.get(font)
+
+    if char_widths is None:
+        char_widths = {}
+        _char_widths_cache.put(font, char_widths)
+
+    for char in set(text).difference(char_widths):
+        char_widths[char] = font.size(char)[0]
+
+    return [*accumulate(map(char_widths.__getitem__, text), initial=initial)]
+
+
+glyph_atlas = GlyphAtlas()
+"""The glyph atlas used by `render_text` and `TextRenderer` with `use_glyph_atlas=True`"""
+
 
 class TextRenderer:
     def __init__(
@@ -23,8 +298,18 @@ class TextRenderer:
             lines_number: int = ...,
             paragraph_space: float | int = 0,
             antialiasing=True,
-            strict_surface_width=False
+            strict_surface_width=False,
+            use_glyph_atlas=False,
+            viewport_mode=False,
+            scroll_offset: float | int = 0
     ):
+        """
+        :param use_glyph_atlas: if true, then the text is composed from the glyphs of `glyph_atlas` instead of
+        rendering it by the font, which is much faster for the frequently changing text
+        :param viewport_mode: if true and the height is specified, then the whole text is parsed, but only the lines
+        visible at `scroll_offset` are rendered, so the Surface has the size of the viewport, not of the whole text
+        :param scroll_offset: the vertical offset of the viewport from the top of the text
+        """
         self._text = text
         self._color = color
         self._pygame_color = as_rgba(color)
@@ -38,10 +323,30 @@ class TextRenderer:
         self._paragraph_space = max(paragraph_space, 0)
         self._antialiasing = antialiasing
         self._strict_surface_width = strict_surface_width
+        self._use_glyph_atlas = use_glyph_atlas
+        self._viewport_mode = viewport_mode
+        self._scroll_offset = max(scroll_offset, 0)
 
         self._parsed_queue = ()
         self._parsed_text_width = self._parsed_text_height = 0
 
+        # ATTENTION: the parsing state is saved at the start of every line, so after changing the text it is parsed
+        # again only from the first line that could be changed. The end indexes are the indexes of the last chars
+        # that were used to wrap the lines
+        self._parse_checkpoints: list[tuple[int, int, int | str, int, int, bool]] = []
+        self._parse_checkpoint_end_indexes: list[int] = []
+        self._parse_max_lines_number = 0
+        self._char_widths_prefix_sums: list[int] = []
+
+        self._line_surfaces: dict[str, TYPE_SURFACE] = {}
+        self._is_multiline_surface = False
+
+        # the line index of the viewport mode, that contains the y position, the index of the segment in the parsed
+        # text and the paragraph space of every non-empty line
+        self._line_ys: list[float | int] = []
+        self._line_segment_indexes: list[int] = []
+        self._line_offsets_x: list[float | int] = []
+
         self.text_surface: TYPE_SURFACE | None = None
 
         self.parse_text()
@@ -52,8 +357,7 @@ class TextRenderer:
         self._text = text
 
         if old_text != self._text:
-            self.parse_text()
-            self.render()
+            self.render(self._relayout_text(old_text))
 
             return True
 
@@ -68,6 +372,7 @@ class TextRenderer:
         self._pygame_color = as_rgba(color)
 
         if old_pygame_alpha_color != self._pygame_color:
+            self._line_surfaces.clear()
             self.render()
 
     def get_color(self) -> TYPE_COLOR:
@@ -116,6 +421,7 @@ class TextRenderer:
         self._font = get_font(font_or_font_size)
 
         if old_font != self._font:
+            self._line_surfaces.clear()
             self.parse_text()
             self.render()
 
@@ -143,6 +449,9 @@ class TextRenderer:
             return
 
         if self._line_spacing > old_line_spacing:
+            if self._viewport_mode:
+                self._update_line_index()
+
             self.render()
             return
 
@@ -185,6 +494,7 @@ class TextRenderer:
         self._antialiasing = antialiasing
 
         if old_antialiasing != antialiasing:
+            self._line_surfaces.clear()
             self.render()
 
     def is_antialiasing(self):
@@ -200,6 +510,79 @@ class TextRenderer:
     def is_strict_surface_width(self):
         return self._strict_surface_width
 
+    def set_use_glyph_atlas(self, use_glyph_atlas: bool):
+        old_use_glyph_atlas = self._use_glyph_atlas
+        self._use_glyph_atlas = use_glyph_atlas
+
+        if old_use_glyph_atlas != use_glyph_atlas:
+            self._line_surfaces.clear()
+            self.render()
+
+    def is_use_glyph_atlas(self):
+        return self._use_glyph_atlas
+
+    def set_viewport_mode(self, viewport_mode: bool):
+        old_viewport_mode = self._viewport_mode
+        self._viewport_mode = viewport_mode
+
+        if old_viewport_mode != viewport_mode:
+            self._line_ys, self._line_segment_indexes, self._line_offsets_x = [], [], []
+            self.parse_text()
+            self.render()
+
+    def is_viewport_mode(self):
+        return self._viewport_mode
+
+    def set_scroll_offset(self, scroll_offset: float | int):
+        """:param scroll_offset: while rendering it is limited by `get_max_scroll_offset`"""
+        old_scroll_offset = self._scroll_offset
+        self._scroll_offset = max(scroll_offset, 0)
+
+        if old_scroll_offset != self._scroll_offset and self._viewport_mode:
+            self.render()
+
+            return True
+
+        return False
+
+    def get_scroll_offset(self):
+        return self._scroll_offset
+
+    def get_max_scroll_offset(self):
+        return max(self._parsed_text_height - self.get_render_size()[1], 0)
+
+    def _blit_piece(self, piece: str, x: float | int, y: float | int, anchor_x: float | int = 0, cached=False):
+        """
+        Drawing the piece onto `text_surface`, the glyphs of `glyph_atlas` are drawn directly without an intermediate
+        Surface
+        :param anchor_x: the part of the width of the piece, by which it is shifted to the left
+        :param cached: if true, then the Surface rendered by the font is saved in `_line_surfaces`
+        :return: the width of the piece
+        """
+        if self._use_glyph_atlas:
+            glyphs = glyph_atlas.get_glyphs(piece, self._font, self._pygame_color, self._antialiasing)
+            piece_width = sum(advance for _, advance in glyphs)
+
+            # ATTENTION: the position is truncated as by `Surface.blit`, so the glyphs are drawn at the same pixels
+            # as the piece rendered by the font
+            self.text_surface.fblits(
+                glyph_atlas.get_glyphs_blit_sequence(glyphs, (int(x - piece_width * anchor_x), y))[0]
+            )
+
+            return piece_width
+
+        piece_surface = self._line_surfaces.get(piece) if cached else None
+
+        if piece_surface is None:
+            piece_surface = self._font.render(piece, self._antialiasing, self._pygame_color)
+
+            if cached:
+                self._line_surfaces[piece] = piece_surface
+
+        self.text_surface.blit(piece_surface, (x - piece_surface.get_width() * anchor_x, y))
+
+        return piece_surface.get_width()
+
     def get_render_size(self):
         return (
             self._width if self._width != SIZE_WRAP_CONTENT and self._strict_surface_width
@@ -212,101 +595,240 @@ class TextRenderer:
         )
 
     def parse_text(self):
+        self._parse_text()
+
+        if self._viewport_mode:
+            self._update_line_index()
+
+    def _relayout_text(self, old_text: str):
+        """
+        Parsing the changed text again only from the first line that could be changed by this change
+        :return: the index of the first changed segment of the parsed text
+        """
+        text = self._text
+
+        if text.startswith(old_text):
+            changed_char_index = len(old_text)
+        else:
+            # the length of the common prefix of the old and the new text is found by the binary search
+            changed_char_index = 0
+            max_char_index = min(len(text), len(old_text))
+
+            while changed_char_index < max_char_index:
+                middle_char_index = (changed_char_index + max_char_index + 1) // 2
+
+                if text.startswith(old_text[changed_char_index:middle_char_index], changed_char_index):
+                    changed_char_index = middle_char_index
+                else:
+                    max_char_index = middle_char_index - 1
+
+        old_parsed_queue = self._parsed_queue
+        first_segment_index = self._parse_text(changed_char_index)
+        max_segment_index = min(len(self._parsed_queue), len(old_parsed_queue))
+
+        while (
+                first_segment_index < max_segment_index
+                and self._parsed_queue[first_segment_index] == old_parsed_queue[first_segment_index]
+        ):
+            first_segment_index += 1
+
+        if self._viewport_mode:
+            self._update_line_index(first_segment_index)
+
+        return first_segment_index
+
+    def _parse_text(self, changed_char_index=0):
+        """
+        :param changed_char_index: the index of the first changed char since the last parsing, the lines before it
+        are kept, if they could not be changed
+        :return: the index of the first segment of the parsed text that could be changed
+        """
         if not self._text or self._lines_number == 0:
             self._parsed_queue = ()
             self._parsed_text_width = self._parsed_text_height = 0
-            return
+            self._parse_checkpoints.clear()
+            self._parse_checkpoint_end_indexes.clear()
+            self._char_widths_prefix_sums = []
+            return 0
 
         font = get_font(self._font_or_font_size)
         char_height = font.get_height()
 
         max_lines_number = self._lines_number
 
-        if self._lines_number is ... and self._height != SIZE_WRAP_CONTENT:
+        # ATTENTION: in the viewport mode the whole text is parsed, because any part of it can be scrolled to
+        is_lines_number_limited = self._height != SIZE_WRAP_CONTENT and (
+                self._lines_number is not ... or not self._viewport_mode
+        )
+
+        if self._lines_number is ... and is_lines_number_limited:
             max_lines_number = int(self._height / (char_height + self._line_spacing)) + 2
 
-        # ATTENTION: the list is made up of integers and strings, where each number in the list indicates the number
-        # of empty lines when drawing. So '\n' will be converted to the number 0, and '\n\n\n' will be converted
-        # to the number 2, and 'a\n\nb' will be converted to the list ['a', 1, 'b']
-        #
-        # ALSO: such a system is necessary so that at the stage of text rendering, if the value `_paragraph_space`
-        # is specified, this value can be applied in those places where a number is indicated in the list
-        parsed_queue = [0]
+        text = self._text
+        text_length = len(text)
+        parse_checkpoints = self._parse_checkpoints
+        parse_checkpoint_end_indexes = self._parse_checkpoint_end_indexes
+
+        # ATTENTION: some setters do not parse the text again, so the checkpoints can be made with the other limit
+        # of the lines number
+        if changed_char_index > 0 and parse_checkpoints and self._parse_max_lines_number == max_lines_number:
+            checkpoint_index = min(
+                bisect_left(parse_checkpoint_end_indexes, changed_char_index),
+                len(parse_checkpoints) - 1
+            )
 
-        char_index = 0
-        line_number = 1
-        text_fragment = ''  # the fragment of text for parsing for one iteration
-        last_space_index = -1  # index of last space char in `text_fragment`
-        reserved_width = 0  # max width of a rendered text representation
+            char_index, queue_length, last_segment, line_number, reserved_width, has_paragraph_space = \
+                parse_checkpoints[checkpoint_index]
 
-        has_paragraph_space = True
+            del parse_checkpoints[checkpoint_index:]
+            del parse_checkpoint_end_indexes[checkpoint_index:]
 
-        while char_index < len(self._text):
-            if self._height != SIZE_WRAP_CONTENT and line_number >= max_lines_number:
+            parsed_queue = [*self._parsed_queue[:queue_length - 1], last_segment]
+
+            if self._width != SIZE_WRAP_CONTENT:
+                # ATTENTION: the prefix sums are changed in place, so only the sums after the changed char are counted
+                self._char_widths_prefix_sums[changed_char_index:] = _get_char_widths_prefix_sums(
+                    font,
+                    text[changed_char_index:],
+                    self._char_widths_prefix_sums[changed_char_index]
+                )
+        else:
+            # ATTENTION: the list is made up of integers and strings, where each number in the list indicates
+            # the number of empty lines when drawing. So '\n' will be converted to the number 0, and '\n\n\n' will
+            # be converted to the number 2, and 'a\n\nb' will be converted to the list ['a', 1, 'b']
+            #
+            # ALSO: such a system is necessary so that at the stage of text rendering, if the value
+            # `_paragraph_space` is specified, this value can be applied in those places where a number is indicated
+            # in the list
+            parsed_queue = [0]
+
+            char_index = 0  # the index of the first char of the current line
+            line_number = 1
+            reserved_width = 0  # max width of a rendered text representation
+
+            has_paragraph_space = True
+
+            parse_checkpoints.clear()
+            parse_checkpoint_end_indexes.clear()
+
+            # ATTENTION: the widths of the lines are found by the prefix sums of the char widths, and then corrected
+            # by the real width of the text, because the font can apply the kerning
+            self._char_widths_prefix_sums = _get_char_widths_prefix_sums(font, text) \
+                if self._width != SIZE_WRAP_CONTENT else []
+
+        self._parse_max_lines_number = max_lines_number
+
+        first_segment_index = len(parsed_queue) - 1
+        char_widths_prefix_sums = self._char_widths_prefix_sums
+
+        while char_index < text_length:
+            if is_lines_number_limited and line_number >= max_lines_number:
                 break
 
-            char = self._text[char_index]
+            parse_checkpoints.append(
+                (char_index, len(parsed_queue), parsed_queue[-1], line_number, reserved_width, has_paragraph_space)
+            )
+
+            line_end_index = text.find('\n', char_index)
+
+            if line_end_index == -1:
+                line_end_index = text_length
 
-            if char == '\n':
-                if text_fragment:
-                    reserved_width = max(reserved_width,
-                                         font.size(text_fragment)[0] + self._paragraph_space * has_paragraph_space)
+            if char_index == line_end_index:
+                parse_checkpoint_end_indexes.append(char_index)
 
-                    parsed_queue.append(text_fragment)
-                    parsed_queue.append(0)
-                elif isinstance(parsed_queue[-1], int):
+                if isinstance(parsed_queue[-1], int):
                     parsed_queue[-1] += 1
 
                 line_number += 1
                 char_index += 1
-                text_fragment = ''
                 has_paragraph_space = True
                 continue
 
-            if char == ' ':
-                last_space_index = char_index
+            overflow_index = line_end_index  # the index of the first char that does not fit into the line
+            overflow_text_width = None  # the width of the text before the overflow char, if it is measured
 
-            if (
-                    self._width != SIZE_WRAP_CONTENT
-                    and font.size(text_fragment + char)[0] > self._width - self._paragraph_space * has_paragraph_space
-            ):
-                if last_space_index > char_index - len(text_fragment):
-                    expected_piece_len = len(text_fragment)
-                    text_fragment = text_fragment[:last_space_index - char_index + len(text_fragment) + 1]
-                    char_index -= expected_piece_len - len(text_fragment)
+            if self._width != SIZE_WRAP_CONTENT:
+                available_width = self._width - self._paragraph_space * has_paragraph_space
+                overflow_index = bisect_right(
+                    char_widths_prefix_sums,
+                    char_widths_prefix_sums[char_index] + available_width,
+                    char_index + 1,
+                    line_end_index + 1
+                ) - 1
 
-                parsed_queue.append(text_fragment)
+                overflow_text_width = font.size(text[char_index:overflow_index])[0]
+
+                while overflow_index > char_index and overflow_text_width > available_width:
+                    overflow_index -= 1
+                    overflow_text_width = font.size(text[char_index:overflow_index])[0]
+
+                while overflow_index < line_end_index:
+                    next_overflow_text_width = font.size(text[char_index:overflow_index + 1])[0]
+
+                    if next_overflow_text_width > available_width:
+                        break
+
+                    overflow_index += 1
+                    overflow_text_width = next_overflow_text_width
+
+            parse_checkpoint_end_indexes.append(overflow_index)
+
+            if overflow_index == line_end_index:
+                text_fragment = text[char_index:line_end_index]
+
+                if overflow_text_width is None:
+                    overflow_text_width = font.size(text_fragment)[0]
 
                 reserved_width = max(
                     reserved_width,
-                    font.size(text_fragment)[0] + self._paragraph_space * has_paragraph_space
+                    overflow_text_width + self._paragraph_space * has_paragraph_space
                 )
-                has_paragraph_space = False
-                text_fragment = ''
+                parsed_queue.append(text_fragment)
+
+                if line_end_index == text_length:
+                    break
+
+                parsed_queue.append(0)
+
                 line_number += 1
+                char_index = line_end_index + 1
+                has_paragraph_space = True
                 continue
 
-            text_fragment += char
+            # the line is broken after the last space, and if there is no space, then just before the overflow char,
+            # but at least one char is kept on the line
+            last_space_index = text.rfind(' ', char_index + 1, overflow_index + 1)
 
-            if char_index == len(self._text) - 1:
-                parsed_queue.append(text_fragment)
+            if last_space_index != -1:
+                next_char_index = min(last_space_index + 1, overflow_index)
+            else:
+                next_char_index = max(overflow_index, char_index + 1)
 
-                reserved_width = max(
-                    reserved_width,
-                    font.size(text_fragment)[0] + self._paragraph_space * has_paragraph_space
-                )
-                break
+            text_fragment = text[char_index:next_char_index]
 
-            char_index += 1
+            parsed_queue.append(text_fragment)
 
-        if reserved_width == -1:
-            reserved_width = font.size(text_fragment)[0]
+            reserved_width = max(
+                reserved_width,
+                (overflow_text_width if next_char_index == overflow_index else font.size(text_fragment)[0])
+                + self._paragraph_space * has_paragraph_space
+            )
+            has_paragraph_space = False
+            line_number += 1
+            char_index = next_char_index
 
         self._parsed_queue = *parsed_queue,
         self._parsed_text_width = reserved_width
         self._parsed_text_height = line_number * char_height + (line_number - 1) * self._line_spacing
 
-    def render(self):
+        return first_segment_index
+
+    def render(self, first_segment_index=0):
+        """
+        :param first_segment_index: the index of the first changed segment of the parsed text, the lines above it are
+        kept from the current `text_surface`, if it is possible
+        """
         if not self._parsed_queue:
             self.text_surface = None
             return
@@ -317,7 +839,11 @@ class TextRenderer:
             self.render_as_singleline_content()
             return
 
-        self.render_as_multiline_content()
+        if self._viewport_mode:
+            self.render_as_viewport_content()
+            return
+
+        self.render_as_multiline_content(first_segment_index)
 
     def render_as_singleline_content(self):
         """This method is faster for the single line content"""
@@ -330,21 +856,15 @@ class TextRenderer:
         y = self._parsed_queue[0] * (self._font.get_height() + self._line_spacing)
 
         self.text_surface = AlphaSurface((renderw, renderh))
+        self._is_multiline_surface = False
 
         if self._align != ALIGN_BLOCK or ' ' not in text or len(text.split()) == 1:
-            base_text_surface = self._font.render(text, self._antialiasing, self._pygame_color)
-
             if self._align == ALIGN_RIGHT:
-                x = renderw - base_text_surface.get_width() - self._paragraph_space
+                self._blit_piece(text, renderw - self._paragraph_space, y, 1)
             elif self._align == ALIGN_CENTER:
-                x = (renderw - base_text_surface.get_width() + self._paragraph_space) / 2
+                self._blit_piece(text, (renderw + self._paragraph_space) / 2, y, 0.5)
             else:
-                x = self._paragraph_space
-
-            self.text_surface.blit(
-                base_text_surface,
-                (x, y)
-            )
+                self._blit_piece(text, self._paragraph_space, y)
         else:
             segment_pieces = text.split(' ')
             space_width = (
@@ -360,27 +880,57 @@ class TextRenderer:
                     continue
 
                 x += spaces_number * space_width
-                piece_surface = self._font.render(piece, self._antialiasing, self._pygame_color)
-                self.text_surface.blit(piece_surface, (x, y))
-                x += piece_surface.get_width()
+                x += self._blit_piece(piece, x, y)
 
                 spaces_number = 1
 
-    def render_as_multiline_content(self):
-        """This method is not optimized for the single line content"""
+    def render_as_multiline_content(self, first_segment_index=0):
+        """
+        This method is not optimized for the single line content
+        :param first_segment_index: the index of the first changed segment of the parsed text, the lines above it are
+        copied from the current `text_surface` instead of rendering them again
+        """
         if not self._parsed_queue:
             self.text_surface = None
             return
 
         renderw, renderh = self.get_render_size()
-        self.text_surface = AlphaSurface((renderw, renderh))
+        old_text_surface = self.text_surface
         char_height = self._font.get_height()
 
+        # ATTENTION: the lines can be copied only if they were rendered at the same positions, and they do not
+        # overlap the changed lines
+        if (
+                old_text_surface is None
+                or not self._is_multiline_surface
+                or old_text_surface.get_width() != renderw
+                or self._line_spacing < 0
+        ):
+            first_segment_index = 0
+
+        first_segment_index = min(first_segment_index, len(self._parsed_queue) - 1)
+
         y = 0
         line_index = 0
         has_paragraph_space = True
 
-        for segment in self._parsed_queue:
+        for segment_index, segment in enumerate(self._parsed_queue):
+            if segment_index == first_segment_index:
+                band_y = int(y + (char_height + self._line_spacing) * (line_index > 0))
+
+                # ATTENTION: if the band starts below the old Surface, then the lines above it could be cut off
+                if first_segment_index > 0 and band_y > old_text_surface.get_height():
+                    self.render_as_multiline_content()
+                    return
+
+                if first_segment_index == 0:
+                    self.text_surface = AlphaSurface((renderw, renderh))
+                elif old_text_surface.get_height() == renderh:
+                    self.text_surface.fill((0, 0, 0, 0), (0, band_y, renderw, max(renderh - band_y, 0)))
+                else:
+                    self.text_surface = AlphaSurface((renderw, renderh))
+                    self.text_surface.blit(old_text_surface, (0, 0), (0, 0, renderw, band_y))
+
             if isinstance(segment, int):
                 has_paragraph_space = True
                 line_index += segment
@@ -391,42 +941,177 @@ class TextRenderer:
 
             y += (char_height + self._line_spacing) * (line_index > 0)
 
-            if self._align != ALIGN_BLOCK or ' ' not in segment or len(segment.split()) == 1:
-                line_surface = self._font.render(segment, self._antialiasing, self._pygame_color)
+            has_paragraph_space = False
+            line_index += 1
 
-                if self._align == ALIGN_RIGHT:
-                    x = renderw - line_surface.get_width() - offset_x
-                elif self._align == ALIGN_CENTER:
-                    x = (renderw - line_surface.get_width() + offset_x) / 2
-                else:
-                    x = offset_x
+            if segment_index < first_segment_index:
+                continue
 
-                self.text_surface.blit(line_surface, (x, y))
-            else:
-                segment_pieces = segment.split(' ')
-                space_width = (renderw - offset_x - self._font.size(segment.replace(' ', ''))[0]) / segment.count(' ')
-                spaces_number = 0
+            self._blit_line(segment, offset_x, y, renderw)
+
+        self._is_multiline_surface = True
+
+        self._prune_line_surfaces(self._parsed_queue)
+
+    def render_as_viewport_content(self):
+        """
+        This method renders only the lines visible at the scroll offset, so its time and the size of the Surface depend
+        on the size of the viewport, not on the size of the text
+        """
+        if not self._parsed_queue:
+            self.text_surface = None
+            return
+
+        renderw, renderh = self.get_render_size()
+        scroll_offset = min(self._scroll_offset, self.get_max_scroll_offset())
+        char_height = self._font.get_height()
+
+        self.text_surface = AlphaSurface((renderw, renderh))
+        self._is_multiline_surface = False
+
+        first_line_index = bisect_right(self._line_ys, scroll_offset - char_height)
+        last_line_index = bisect_left(self._line_ys, scroll_offset + renderh)
+        visible_segments = []
 
-                x = offset_x
+        for line_index in range(first_line_index, last_line_index):
+            segment = self._parsed_queue[self._line_segment_indexes[line_index]]
+            visible_segments.append(segment)
 
-                for piece in segment_pieces:
-                    if not piece:
-                        spaces_number += 1
-                        continue
+            self._blit_line(
+                segment,
+                self._line_offsets_x[line_index],
+                self._line_ys[line_index] - scroll_offset,
+                renderw
+            )
+
+        self._prune_line_surfaces(visible_segments)
 
-                    x += spaces_number * space_width
-                    piece_surface = self._font.render(piece, self._antialiasing, self._pygame_color)
-                    self.text_surface.blit(piece_surface, (x, y))
-                    x += piece_surface.get_width()
+    def _update_line_index(self, first_segment_index=0):
+        """:param first_segment_index: the index of the first changed segment, the lines before it are kept"""
+        kept_lines_number = bisect_left(self._line_segment_indexes, first_segment_index)
 
-                    spaces_number = 1
+        del self._line_ys[kept_lines_number:]
+        del self._line_segment_indexes[kept_lines_number:]
+        del self._line_offsets_x[kept_lines_number:]
+
+        line_height = self._font.get_height() + self._line_spacing
+
+        if kept_lines_number == 0:
+            segment_index = y = line_index = 0
+            has_paragraph_space = True
+        else:
+            # the state after the last kept line
+            segment_index = self._line_segment_indexes[-1] + 1
+            y = self._line_ys[-1]
+            line_index = 1
+            has_paragraph_space = False
+
+        for segment_index in range(segment_index, len(self._parsed_queue)):
+            segment = self._parsed_queue[segment_index]
+
+            if isinstance(segment, int):
+                has_paragraph_space = True
+                line_index += segment
+                y += line_height * segment
+                continue
+
+            y += line_height * (line_index > 0)
+
+            self._line_ys.append(y)
+            self._line_segment_indexes.append(segment_index)
+            self._line_offsets_x.append(self._paragraph_space * has_paragraph_space)
 
             has_paragraph_space = False
             line_index += 1
 
+    def _blit_line(self, segment: str, offset_x: float | int, y: float | int, renderw: int):
+        if self._align != ALIGN_BLOCK or ' ' not in segment or len(segment.split()) == 1:
+            if self._align == ALIGN_RIGHT:
+                self._blit_piece(segment, renderw - offset_x, y, 1, True)
+            elif self._align == ALIGN_CENTER:
+                self._blit_piece(segment, (renderw + offset_x) / 2, y, 0.5, True)
+            else:
+                self._blit_piece(segment, offset_x, y, cached=True)
+
+            return
+
+        segment_pieces = segment.split(' ')
+        space_width = (renderw - offset_x - self._font.size(segment.replace(' ', ''))[0]) / segment.count(' ')
+        spaces_number = 0
+
+        x = offset_x
+
+        for piece in segment_pieces:
+            if not piece:
+                spaces_number += 1
+                continue
+
+            x += spaces_number * space_width
+            x += self._blit_piece(piece, x, y)
+
+            spaces_number = 1
+
+    def _prune_line_surfaces(self, segments: Sequence[int | str]):
+        # the Surfaces of the lines that are no longer rendered are removed only from time to time, so the cache
+        # is bounded by the number of the rendered lines
+        if len(self._line_surfaces) > 2 * len(segments):
+            segments = {*segments}
+            self._line_surfaces = {
+                segment: line_surface for segment, line_surface in self._line_surfaces.items() if segment in segments
+            }
+
+
+def render_text(
+        text: str,
+        color: TYPE_COLOR,
+        font_or_font_size: TYPE_FONT = DEFAULT_FONT_SIZE,
+        antialiasing=True,
+        use_glyph_atlas=False,
+        cached=True
+):
+    """
+    :param use_glyph_atlas: if true, then the text is composed from the glyphs of `glyph_atlas` instead of
+    rendering it by the font
+    :param cached: if true, then the rendered Surface is saved in `text_surface_cache`, so the same text is rendered
+    only once. ATTENTION: the cached Surface is shared, so it should be copied before changing
+    """
+    font = get_font(font_or_font_size)
+    color = as_rgba(color)
+
+    if not cached:
+        return _render_text(text, color, font, antialiasing, use_glyph_atlas)
+
+    key = text, color, font, antialiasing, use_glyph_atlas
+    text_surface = text_surface_cache.get(key)
+
+    if text_surface is None:
+        text_surface = _render_text(text, color, font, antialiasing, use_glyph_atlas)
+        text_surface_cache.put(key, text_surface)
+
+    return text_surface
+
+
+def _render_text(text: str, color: Sequence[int], font: FontType, antialiasing: bool, use_glyph_atlas: bool):
+    if use_glyph_atlas:
+        return glyph_atlas.render(text, font, color, antialiasing)
+
+    return font.render(text, antialiasing, color)
+
+
+def invalidate_rendered_text(font_or_font_size: TYPE_FONT = ...):
+    """
+    Removing the Surfaces from `text_surface_cache`
+    :param font_or_font_size: if specified, then only the Surfaces of this font are removed, otherwise all of them
+    """
+    if font_or_font_size is ...:
+        text_surface_cache.clear()
+        return
+
+    font = get_font(font_or_font_size)
 
-def render_text(text: str, color: TYPE_COLOR, font_or_font_size: TYPE_FONT = DEFAULT_FONT_SIZE, antialiasing=True):
-    return get_font(font_or_font_size).render(text, antialiasing, as_rgba(color))
+    for key in text_surface_cache:
+        if key[2] is font:
+            text_surface_cache.pop(key)
 
 
 __all__ = (
@@ -435,6 +1120,14 @@ __all__ = (
     'ALIGN_CENTER',
     'ALIGN_BLOCK',
     'SIZE_WRAP_CONTENT',
+    'GLYPH_ATLAS_INITIAL_SIZE',
+    'GLYPH_ATLAS_MAX_SIZE',
+    'GLYPH_ATLAS_PADDING',
+    'TEXT_SURFACE_CACHE_MAX_BYTES',
+    'text_surface_cache',
+    'GlyphAtlas',
+    'glyph_atlas',
     'TextRenderer',
-    'render_text'
+    'render_text',
+    'invalidate_rendered_text'
 )
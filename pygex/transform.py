@@ -1,12 +1,101 @@
+from pygame.mask import from_threshold as pg_mask_from_threshold, from_surface as pg_mask_from_surface
 from pygame.image import frombuffer as pg_image_frombuffer, tostring as pg_image_tostring
+from pygame.transform import smoothscale as pg_smoothscale, scale as pg_transform_scale
 from pygame.draw import rect as pg_draw_rect, ellipse as pg_draw_ellipse
 from pygex.color import COLOR_BLACK, COLOR_WHITE, TYPE_COLOR, as_rgba
-from pygame.transform import smoothscale as pg_smoothscale
+from pygame.constants import SRCALPHA, BLEND_RGBA_MULT
 from pygex.core.constants import MAX_BORDER_RADIUS
+from math import radians, cos, sin, hypot, pi, inf
 from pygame.surface import Surface, SurfaceType
-from pygame.constants import SRCALPHA
+from pygex.surface import AlphaSurface
+from pygex.cache import LRUCache
+from pygame.mask import MaskType
+from time import perf_counter
 from typing import Sequence
 
+try:
+    from pygame.surfarray import pixels3d as pg_surfarray_pixels3d, pixels_alpha as pg_surfarray_pixels_alpha
+    import numpy as np
+except ImportError:
+    np = None
+
+_NUMPY_IS_REQUIRED_MESSAGE = 'For using %s needs to install numpy module first: `pip install numpy`'
+
+ROUND_CORNERS_ANTIALIASING_SCALE = 4
+ROUND_CORNERS_MASK_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+GRADIENT_TYPE_LINEAR = 0
+GRADIENT_TYPE_RADIAL = 1
+GRADIENT_TYPE_CONIC = 2
+
+GRADIENT_LUT_SIZE = 1024
+GRADIENT_LUT_CACHE_MAX_SIZE = 64
+
+DEFAULT_BLUR_PASSES = 3
+BLUR_BUFFERS_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+PIPELINE_OPERATION_FILL = 'fill'
+PIPELINE_OPERATION_GRADIENT = 'gradient'
+PIPELINE_OPERATION_ROUND_CORNERS = 'round_corners'
+PIPELINE_OPERATION_BLUR = 'blur'
+PIPELINE_OPERATION_TINT = 'tint'
+PIPELINE_OPERATION_BORDER = 'border'
+
+BLUR_OPERATION_GAUSSIAN = 'gaussian_blur'
+BLUR_OPERATION_BOX = 'box_blur'
+
+BLUR_BACKEND_PYGAME = 'pygame'
+BLUR_BACKEND_PILLOW = 'pillow'
+BLUR_BACKEND_NUMPY = 'numpy'
+
+# ATTENTION: the upper bounds of the biggest side of Surface for size classes and the sizes of Surfaces that are used
+# to calibrate the blur backends for these size classes
+BLUR_SIZE_CLASSES_BOUNDS = 64, 256, 1024
+BLUR_CALIBRATION_SIZES = (64, 64), (256, 256), (1024, 1024), (1920, 1080)
+
+# the backends in the order of preference, which is used for the size classes that are not calibrated
+BLUR_DEFAULT_BACKENDS = BLUR_BACKEND_PILLOW, BLUR_BACKEND_PYGAME, BLUR_BACKEND_NUMPY
+
+# ATTENTION: the kernel of `pygame.transform.gaussian_blur` has the standard deviation `radius` and is cut off at
+# `2 * radius`, so the standard deviation of the blur itself is about `0.88 * radius`
+_PYGAME_GAUSSIAN_BLUR_STANDARD_DEVIATION_FACTOR = 0.88
+
+# ATTENTION: the matrix of 4x4 ordered (Bayer) dithering, which thresholds are `(value + 0.5) / 16`
+_BAYER_MATRIX = (
+    (0, 8, 2, 10),
+    (12, 4, 14, 6),
+    (3, 11, 1, 9),
+    (15, 7, 13, 5)
+)
+
+
+def _get_mask_size_in_bytes(mask: MaskType | SurfaceType):
+    width, height = mask.get_size()
+
+    if isinstance(mask, SurfaceType):
+        return width * height * mask.get_bytesize()
+
+    return width * height // 8 + 1
+
+
+round_corners_mask_cache = LRUCache(ROUND_CORNERS_MASK_CACHE_MAX_BYTES, _get_mask_size_in_bytes)
+"""
+The cache of masks built by `round_corners()` keyed by the size and the radii. The size of the cache is bounded
+by the number of bytes `ROUND_CORNERS_MASK_CACHE_MAX_BYTES` (can be changed by `max_size`), and its statistics are
+available by `info`
+"""
+
+gradient_lut_cache = LRUCache(GRADIENT_LUT_CACHE_MAX_SIZE)
+"""The cache of color lookup tables built by `get_gradient_lut()` keyed by the colors and their positions"""
+
+_blur_backends = {BLUR_OPERATION_GAUSSIAN: {}, BLUR_OPERATION_BOX: {}}
+_blur_decision_table: dict[tuple[str, int], tuple[str, dict[str, float]]] = {}
+
+# ATTENTION: the downsampled scratch surfaces and the float buffers of `blur()` are reused between calls, so the blur
+# of the same size does not allocate them every frame
+_blur_scratch_surfaces = LRUCache(8)
+_blur_buffers = LRUCache(BLUR_BUFFERS_CACHE_MAX_BYTES, lambda buffers: buffers[0].nbytes + buffers[1].nbytes)
+
 
 try:
     from PIL import Image as PillowImage, ImageFilter as PillowImageFilter
@@ -26,6 +115,14 @@ try:
         :param radius: blur radius
         """
         return pillow_to_pygame(pygame_to_pillow(source_surface).filter(PillowImageFilter.GaussianBlur(radius)))
+
+
+    def _pillow_box_blur(source_surface: SurfaceType, radius: int):
+        return pillow_to_pygame(pygame_to_pillow(source_surface).filter(PillowImageFilter.BoxBlur(round(radius))))
+
+
+    _blur_backends[BLUR_OPERATION_GAUSSIAN][BLUR_BACKEND_PILLOW] = fast_gaussian_blur
+    _blur_backends[BLUR_OPERATION_BOX][BLUR_BACKEND_PILLOW] = _pillow_box_blur
 except ImportError:
     pass
 
@@ -36,63 +133,725 @@ def cutout_by_mask(source_surface: SurfaceType, mask: SurfaceType):
     :param source_surface: source Surface
     :param mask: mask for cutout
     """
+    return _cutout_by_pygame_mask(source_surface, _get_cutout_mask(mask))
+
+
+def _get_cutout_mask(mask: SurfaceType):
+    cutout_mask = pg_mask_from_threshold(mask, (0, 0, 0, 255), (1, 1, 1, 255))
+
+    # ATTENTION: `from_threshold()` does not take into account the alpha channel, so for the mask with alpha channel
+    # only its opaque pixels are left
+    if mask.get_flags() & SRCALPHA:
+        cutout_mask = cutout_mask.overlap_mask(pg_mask_from_surface(mask, 254), (0, 0))
+
+    return cutout_mask
+
+
+def _cutout_by_pygame_mask(source_surface: SurfaceType, cutout_mask: MaskType):
     new_source = source_surface.copy()
+    cutout_mask.to_surface(new_source, setcolor=(0, 0, 0, 0), unsetcolor=None)
+
+    return new_source
 
-    for x in range(0, source_surface.get_size()[0]):
-        for y in range(0, source_surface.get_size()[1]):
-            if mask.get_at((x, y)) == (0, 0, 0, 255):
-                new_source.set_at((x, y), 0x00000000)
+
+def cutout_by_alpha_mask(source_surface: SurfaceType, alpha_mask: SurfaceType):
+    """
+    Anti-aliased version of the cutout, in which the alpha channel of the source is multiplied by the alpha channel
+    of the mask, so the mask should be white with the alpha channel of the shape coverage
+    :param source_surface: source Surface
+    :param alpha_mask: white mask with alpha channel for cutout
+    """
+    new_source = source_surface.copy()
+    new_source.blit(alpha_mask, (0, 0), special_flags=BLEND_RGBA_MULT)
 
     return new_source
 
 
+def _draw_round_corners_shape(surface: SurfaceType, color: TYPE_COLOR, radii: Sequence[int], scale: int = 1):
+    if MAX_BORDER_RADIUS in radii:
+        pg_draw_ellipse(surface, color, surface.get_rect())
+    else:
+        pg_draw_rect(surface, color, surface.get_rect(), 0, -1, *(radius * scale for radius in radii))
+
+
 def round_corners(
         source_surface: SurfaceType,
         border_top_left_radius: int,
         border_top_right_radius: int,
         border_bottom_left_radius: int,
-        border_bottom_right_radius: int
+        border_bottom_right_radius: int,
+        antialiasing=False
 ):
-    mask_surface = Surface(source_surface.get_size())
+    """
+    :param antialiasing: if true, then the corners are drawn with smooth edges (only for Surface with alpha channel)
+    """
+    mask = _get_round_corners_mask(
+        source_surface.get_size(),
+        (border_top_left_radius, border_top_right_radius, border_bottom_left_radius, border_bottom_right_radius),
+        antialiasing
+    )
+
+    if antialiasing:
+        return cutout_by_alpha_mask(source_surface, mask)
+
+    return _cutout_by_pygame_mask(source_surface, mask)
+
+
+def _get_round_corners_mask(size: Sequence[int], radii: Sequence[int], antialiasing: bool):
+    if MAX_BORDER_RADIUS in radii:
+        radii = (MAX_BORDER_RADIUS,) * 4
+
+    mask_key = *size, *radii, antialiasing
+    mask = round_corners_mask_cache.get(mask_key)
+
+    if mask is None:
+        mask = _render_round_corners_mask(size, radii, antialiasing)
+        round_corners_mask_cache.put(mask_key, mask)
+
+    return mask
+
+
+def _render_round_corners_mask(size: Sequence[int], radii: Sequence[int], antialiasing: bool):
+    if antialiasing:
+        scale = ROUND_CORNERS_ANTIALIASING_SCALE
+
+        mask_surface = AlphaSurface((size[0] * scale, size[1] * scale))
+        mask_surface.fill((255, 255, 255, 0))
+        _draw_round_corners_shape(mask_surface, (255, 255, 255, 255), radii, scale)
+
+        return pg_smoothscale(mask_surface, size)
+
+    mask_surface = Surface(size)
     mask_surface.fill(COLOR_BLACK)
+    _draw_round_corners_shape(mask_surface, COLOR_WHITE, radii)
 
-    if MAX_BORDER_RADIUS in (
-            border_top_left_radius,
-            border_top_right_radius,
-            border_bottom_left_radius,
-            border_bottom_right_radius
-    ):
-        pg_draw_ellipse(mask_surface, COLOR_WHITE, mask_surface.get_rect())
+    return _get_cutout_mask(mask_surface)
+
+
+def get_gradient_lut(colors: Sequence[TYPE_COLOR], positions: Sequence[float] = ...):
+    """
+    Getting the color lookup table of the gradient (requires `numpy`)
+    :param colors: gradient colors
+    :param positions: positions of colors from 0 to 1, if not specified, then colors are evenly spaced
+    :return: read-only array of floats with the shape `(GRADIENT_LUT_SIZE, 4)` containing RGBA colors
+    """
+    return _get_gradient_luts(colors, positions)[0]
+
+
+def _get_gradient_luts(colors: Sequence[TYPE_COLOR], positions: Sequence[float]):
+    """Both float and rounded to bytes versions of the lookup table"""
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`get_gradient_lut`')
+
+    if not colors:
+        raise ValueError('Gradient must have at least one color')
+
+    rgba_colors = tuple(_as_rgba_tuple(color) for color in colors)
+
+    if positions is ...:
+        positions = tuple(i / max(len(colors) - 1, 1) for i in range(len(colors)))
     else:
-        pg_draw_rect(
-            mask_surface,
-            COLOR_WHITE,
-            mask_surface.get_rect(),
-            0,
-            -1,
-            border_top_left_radius,
-            border_top_right_radius,
-            border_bottom_left_radius,
-            border_bottom_right_radius
-        )
+        positions = tuple(positions)
+
+        if len(positions) != len(colors):
+            raise ValueError('Number of gradient positions must be the same as number of colors')
+
+        if any(positions[i] > positions[i + 1] for i in range(len(positions) - 1)):
+            raise ValueError('Gradient positions must be in ascending order')
+
+    luts_key = rgba_colors, positions
+    luts = gradient_lut_cache.get(luts_key)
+
+    if luts is None:
+        lut_positions = np.linspace(0, 1, GRADIENT_LUT_SIZE)
+        lut = np.stack(
+            [np.interp(lut_positions, positions, [color[i] for color in rgba_colors]) for i in range(4)],
+            axis=-1
+        ).astype(np.float32)
+        bytes_lut = (lut + 0.5).astype(np.uint8)
+
+        lut.setflags(write=False)
+        bytes_lut.setflags(write=False)
 
-    return cutout_by_mask(source_surface, mask_surface)
+        luts = lut, bytes_lut
+        gradient_lut_cache.put(luts_key, luts)
 
+    return luts
 
-def gradient(size: Sequence[int], colors: Sequence[TYPE_COLOR], is_vertical=False):
+
+def _as_rgba_tuple(color: TYPE_COLOR):
+    color = as_rgba(color)
+
+    if color is None:
+        return 0, 0, 0, 0
+
+    return (*color, 0xff) if len(color) == 3 else (*color,)
+
+
+def _get_gradient_parameter(size: Sequence[int], gradient_type: int, angle: float):
+    """The position in the gradient from 0 to 1 for every pixel as array with the shape `(height, width)`"""
+    width, height = size
+    xs = (np.arange(width, dtype=np.float32) + 0.5)[None, :]
+    ys = (np.arange(height, dtype=np.float32) + 0.5)[:, None]
+    angle = radians(angle)
+
+    if gradient_type == GRADIENT_TYPE_RADIAL:
+        return np.hypot(xs - width / 2, ys - height / 2) / (hypot(width, height) / 2)
+
+    if gradient_type == GRADIENT_TYPE_CONIC:
+        return ((np.arctan2(ys - height / 2, xs - width / 2) - angle) / (2 * pi)) % 1
+
+    direction_x, direction_y = cos(angle), sin(angle)
+    corner_projections = 0, width * direction_x, height * direction_y, width * direction_x + height * direction_y
+    min_projection, max_projection = min(corner_projections), max(corner_projections)
+
+    return (xs * direction_x + ys * direction_y - min_projection) / max(max_projection - min_projection, 1e-6)
+
+
+def _get_lut_indexes(gradient_parameter):
+    return np.clip(gradient_parameter * (GRADIENT_LUT_SIZE - 1) + 0.5, 0, GRADIENT_LUT_SIZE - 1).astype(np.intp)
+
+
+def _gradient_by_scaling(
+        size: Sequence[int],
+        colors: Sequence[TYPE_COLOR],
+        is_vertical: bool,
+        dest_surface: SurfaceType | None
+):
     colors_line_surface = Surface((1, len(colors)) if is_vertical else (len(colors), 1), SRCALPHA, 32)
 
     for i in range(len(colors)):
         colors_line_surface.set_at((0, i) if is_vertical else (i, 0), as_rgba(colors[i]))
 
-    return pg_smoothscale(colors_line_surface, size)
+    if dest_surface is None:
+        return pg_smoothscale(colors_line_surface, size)
+
+    # ATTENTION: `smoothscale` works only with 24 and 32 bit Surfaces, and the source must have the same format as
+    # the destination
+    if dest_surface.get_bitsize() not in (24, 32):
+        raise ValueError('The destination Surface of the gradient must be 24 or 32 bit')
+
+    return pg_smoothscale(colors_line_surface.convert(dest_surface), size, dest_surface)
+
+
+def gradient(
+        size: Sequence[int],
+        colors: Sequence[TYPE_COLOR],
+        is_vertical=False,
+        positions: Sequence[float] = ...,
+        angle: float = ...,
+        gradient_type=GRADIENT_TYPE_LINEAR,
+        dithering=False,
+        dest_surface: SurfaceType = None
+):
+    """
+    Gradient rendering. Without `numpy` only evenly spaced horizontal or vertical linear gradients are supported
+    :param size: size of the output Surface
+    :param colors: gradient colors
+    :param is_vertical: if true and angle is not specified, then the gradient goes from top to bottom
+    :param positions: positions of colors from 0 to 1, if not specified, then colors are evenly spaced
+    :param angle: angle in degrees clockwise from the direction from left to right (for linear and conic gradients)
+    :param gradient_type: any of: GRADIENT_TYPE_LINEAR, GRADIENT_TYPE_RADIAL, GRADIENT_TYPE_CONIC
+    :param dithering: if true, then ordered dithering is applied to avoid color banding
+    :param dest_surface: the Surface of the same size with alpha channel into which the gradient will be written
+    """
+    if angle is ...:
+        angle = 90 if is_vertical else 0
+
+    if dest_surface is not None and dest_surface.get_size() != (int(size[0]), int(size[1])):
+        raise ValueError('The destination Surface of the gradient must have the same size as the gradient')
+
+    if np is None:
+        if gradient_type != GRADIENT_TYPE_LINEAR or positions is not ... or angle not in (0, 90) or dithering:
+            raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % 'this gradient')
+
+        return _gradient_by_scaling(size, colors, angle == 90, dest_surface)
+
+    width, height = size = int(size[0]), int(size[1])
+
+    if width <= 0 or height <= 0:
+        return AlphaSurface((max(width, 0), max(height, 0))) if dest_surface is None else dest_surface
+
+    lut, bytes_lut = _get_gradient_luts(colors, positions)
+
+    # ATTENTION: axis-aligned linear gradient is the same along one of the axes, so only one line of pixels
+    # is computed, and then it is stretched over the whole Surface
+    if gradient_type == GRADIENT_TYPE_LINEAR and angle % 90 == 0 and not dithering:
+        is_vertical = angle % 180 != 0
+        line_size = (1, height) if is_vertical else (width, 1)
+        pixels = bytes_lut[_get_lut_indexes(_get_gradient_parameter(line_size, gradient_type, angle))]
+
+        line_surface = pg_image_frombuffer(pixels.tobytes(), line_size, 'RGBA')
+
+        if dest_surface is None:
+            return pg_transform_scale(line_surface, size)
+
+        return pg_transform_scale(line_surface.convert(dest_surface), size, dest_surface)
+
+    lut_indexes = _get_lut_indexes(_get_gradient_parameter(size, gradient_type, angle))
+
+    if dithering:
+        thresholds = (np.array(_BAYER_MATRIX, dtype=np.float32) + 0.5) / 16
+        pixels = lut[lut_indexes]
+        pixels += np.tile(thresholds, (height // 4 + 1, width // 4 + 1))[:height, :width, None]
+        pixels = np.clip(pixels, 0, 255).astype(np.uint8)
+    else:
+        pixels = bytes_lut[lut_indexes]
+
+    if dest_surface is None:
+        return pg_image_frombuffer(pixels, size, 'RGBA')
+
+    pixels = pixels.transpose(1, 0, 2)
+    pg_surfarray_pixels3d(dest_surface)[...] = pixels[..., :3]
+    pg_surfarray_pixels_alpha(dest_surface)[...] = pixels[..., 3]
+
+    return dest_surface
+
+
+def _get_box_blur_radii(radius: float | int, passes: int):
+    """
+    Radii of box blurs, the successive application of which approximates the gaussian blur with the standard
+    deviation `radius`
+    """
+    ideal_box_size = (12 * radius * radius / passes + 1) ** 0.5
+    lower_box_size = int(ideal_box_size)
+
+    if lower_box_size % 2 == 0:
+        lower_box_size -= 1
+
+    lower_boxes_number = round(
+        (12 * radius * radius - passes * lower_box_size ** 2 - 4 * passes * lower_box_size - 3 * passes)
+        / (-4 * lower_box_size - 4)
+    )
+
+    return tuple(
+        (lower_box_size - 1) // 2 if i < lower_boxes_number else (lower_box_size + 1) // 2 for i in range(passes)
+    )
+
+
+def _box_blur_pixels(pixels, box_radius: int, axis: int, padded_buffer):
+    """
+    Box blur along the axis with the edge pixels repeated, its cost does not depend on the radius. The result is
+    written back into `pixels`, and `padded_buffer` is the flat float32 array that is used for the cumulative sums
+    """
+    box_size = box_radius * 2 + 1
+    length = pixels.shape[axis]
+    padded_shape = list(pixels.shape)
+    padded_shape[axis] = length + box_size
+    padded_pixels = padded_buffer[:np.prod(padded_shape)].reshape(padded_shape)
+
+    # the views of the padded pixels along the axis: the edge before, the pixels and the edge after
+    before_slices, middle_slices, after_slices, first_slices, last_slices = [
+        [slice(None)] * pixels.ndim for _ in range(5)
+    ]
+    before_slices[axis] = slice(None, box_radius + 1)
+    middle_slices[axis] = slice(box_radius + 1, box_radius + 1 + length)
+    after_slices[axis] = slice(box_radius + 1 + length, None)
+    first_slices[axis], last_slices[axis] = slice(None, 1), slice(length - 1, None)
+
+    padded_pixels[tuple(middle_slices)] = pixels
+    padded_pixels[tuple(before_slices)] = pixels[tuple(first_slices)]
+    padded_pixels[tuple(after_slices)] = pixels[tuple(last_slices)]
+
+    np.cumsum(padded_pixels, axis=axis, out=padded_pixels)
+
+    upper_slices, lower_slices = [slice(None)] * pixels.ndim, [slice(None)] * pixels.ndim
+    upper_slices[axis], lower_slices[axis] = slice(box_size, None), slice(None, -box_size)
+
+    np.subtract(padded_pixels[tuple(upper_slices)], padded_pixels[tuple(lower_slices)], out=pixels)
+    pixels /= box_size
+
+
+def _get_blur_buffers(width: int, height: int, channels_number: int, max_box_radius: int):
+    """The float32 array of the pixels and the flat array for the padded pixels, which are reused between calls"""
+    key = width, height, channels_number
+    padded_buffer_size = (width * height + (max_box_radius * 2 + 1) * max(width, height)) * channels_number
+    buffers = _blur_buffers.get(key)
+
+    if buffers is None or buffers[1].size < padded_buffer_size:
+        buffers = np.empty((width, height, channels_number), dtype=np.float32), np.empty(
+            padded_buffer_size,
+            dtype=np.float32
+        )
+        _blur_buffers.put(key, buffers)
+
+    return buffers
+
+
+def _get_surface_format(surface: SurfaceType):
+    return surface.get_bitsize(), surface.get_masks()
+
+
+def blur(
+        source_surface: SurfaceType,
+        radius: float | int,
+        downsample: int = 1,
+        passes: int = DEFAULT_BLUR_PASSES,
+        dest_surface: SurfaceType = None
+):
+    """
+    Fast approximation of gaussian blur by a few passes of box blur, which works directly with the pixels
+    of Surfaces (requires `numpy`). The float buffers and the downsampled Surfaces are reused between calls,
+    so with `dest_surface` the blur of the same size does not allocate memory
+    :param source_surface: source Surface (24 or 32 bit)
+    :param radius: blur radius (the standard deviation of gaussian)
+    :param downsample: the quality knob, if greater than 1, then the blur is done on the Surface reduced
+    by this factor, and then the result is scaled back up
+    :param passes: the number of box blurs, 1 is just a box blur and 3 is already close to gaussian
+    :param dest_surface: the Surface of the same size into which the result will be written, can be the source
+    itself. With `downsample` it must also have the same format as the source
+    """
+    if np is None:
+        raise ModuleNotFoundError(_NUMPY_IS_REQUIRED_MESSAGE % '`blur`')
+
+    size = source_surface.get_size()
+    surface_format = _get_surface_format(source_surface)
+
+    if surface_format[0] not in (24, 32):
+        raise ValueError('The Surface of the blur must be 24 or 32 bit')
+
+    if dest_surface is not None and dest_surface.get_size() != size:
+        raise ValueError('The destination Surface of the blur must have the same size as the source')
+
+    if downsample > 1:
+        # ATTENTION: `smoothscale` requires the same format of the source and the destination
+        if dest_surface is not None and _get_surface_format(dest_surface) != surface_format:
+            raise ValueError('The destination Surface of the downsampled blur must have the same format as the source')
+
+        scratch_size = max(size[0] // downsample, 1), max(size[1] // downsample, 1)
+        scratch_flags = source_surface.get_flags() & SRCALPHA
+        scratch_key = *scratch_size, scratch_flags, *surface_format
+        scratch_surface = _blur_scratch_surfaces.get(scratch_key)
+
+        if scratch_surface is None:
+            scratch_surface = Surface(scratch_size, scratch_flags, source_surface)
+            _blur_scratch_surfaces.put(scratch_key, scratch_surface)
+
+        pg_smoothscale(source_surface, scratch_size, scratch_surface)
+        blur(scratch_surface, radius / downsample, passes=passes, dest_surface=scratch_surface)
+
+        if dest_surface is None:
+            return pg_smoothscale(scratch_surface, size)
+
+        return pg_smoothscale(scratch_surface, size, dest_surface)
+
+    if dest_surface is None:
+        dest_surface = source_surface.copy()
+
+    if 0 in size:
+        return dest_surface
+
+    has_alpha = source_surface.get_flags() & SRCALPHA
+    box_radii = _get_box_blur_radii(radius, passes)
+    pixels, padded_buffer = _get_blur_buffers(*size, 3 + bool(has_alpha), max(box_radii))
+
+    pixels[..., :3] = pg_surfarray_pixels3d(source_surface)
+
+    if has_alpha:
+        pixels[..., 3] = pg_surfarray_pixels_alpha(source_surface)
+
+    for box_radius in box_radii:
+        if box_radius > 0:
+            _box_blur_pixels(pixels, box_radius, 0, padded_buffer)
+            _box_blur_pixels(pixels, box_radius, 1, padded_buffer)
+
+    pixels += 0.5
+
+    pg_surfarray_pixels3d(dest_surface)[...] = pixels[..., :3]
+
+    if dest_surface.get_flags() & SRCALPHA:
+        pg_surfarray_pixels_alpha(dest_surface)[...] = pixels[..., 3] if has_alpha else 0xff
+
+    return dest_surface
+
+
+try:
+    from pygame.transform import gaussian_blur as pg_gaussian_blur, box_blur as pg_box_blur
+
+    def _pygame_gaussian_blur(surface: SurfaceType, radius: float | int):
+        pygame_radius = round(radius / _PYGAME_GAUSSIAN_BLUR_STANDARD_DEVIATION_FACTOR)
+
+        # ATTENTION: `pygame.transform.gaussian_blur` with the zero radius returns the transparent Surface
+        if pygame_radius <= 0:
+            return surface.copy()
+
+        return pg_gaussian_blur(surface, pygame_radius)
+
+    _blur_backends[BLUR_OPERATION_GAUSSIAN][BLUR_BACKEND_PYGAME] = _pygame_gaussian_blur
+    _blur_backends[BLUR_OPERATION_BOX][BLUR_BACKEND_PYGAME] = lambda surface, radius: pg_box_blur(
+        surface,
+        round(radius)
+    )
+except ImportError:
+    pass
+
+if np is not None:
+    _blur_backends[BLUR_OPERATION_GAUSSIAN][BLUR_BACKEND_NUMPY] = blur
+
+    # ATTENTION: `blur()` takes the standard deviation, which is converted here from the radius of the single box
+    _blur_backends[BLUR_OPERATION_BOX][BLUR_BACKEND_NUMPY] = lambda surface, radius: blur(
+        surface,
+        (((2 * round(radius) + 1) ** 2 - 1) / 12) ** 0.5,
+        passes=1
+    )
+
+
+def get_blur_size_class(size: Sequence[int]):
+    """Getting the index of the size class of Surface for the blur backends decision table"""
+    biggest_side = max(size)
+
+    for size_class, size_class_bound in enumerate(BLUR_SIZE_CLASSES_BOUNDS):
+        if biggest_side <= size_class_bound:
+            return size_class
+
+    return len(BLUR_SIZE_CLASSES_BOUNDS)
+
+
+def get_blur_backends(operation: str):
+    """Getting the names of available backends of the blur operation"""
+    return (*_blur_backends[operation],)
+
+
+def calibrate_blur_backends(
+        operations: Sequence[str] = (BLUR_OPERATION_GAUSSIAN, BLUR_OPERATION_BOX),
+        size_classes: Sequence[int] = ...,
+        radius: float | int = 8,
+        repeats: int = 2
+):
+    """
+    Measuring the available backends of the blur operations and saving the fastest of them for every size class.
+    ATTENTION: it blurs the Surfaces of `BLUR_CALIBRATION_SIZES` by every backend, which takes a few seconds, so it
+    is never called implicitly and should be called at startup or during loading. Until then the first available
+    backend of `BLUR_DEFAULT_BACKENDS` is used
+    :param operations: any of: BLUR_OPERATION_GAUSSIAN, BLUR_OPERATION_BOX
+    :param size_classes: size classes to calibrate, if not specified, then all of them are calibrated
+    :param radius: blur radius used for measuring
+    :param repeats: the number of measurements of every backend, the best one is taken
+    """
+    if size_classes is ...:
+        size_classes = range(len(BLUR_CALIBRATION_SIZES))
+
+    for operation in operations:
+        for size_class in size_classes:
+            test_surface = AlphaSurface(BLUR_CALIBRATION_SIZES[size_class])
+            test_surface.fill((0x80, 0x40, 0x20, 0xff))
+            timings = {}
+
+            for backend_name, backend in _blur_backends[operation].items():
+                timings[backend_name] = inf
+
+                for _ in range(repeats):
+                    start_time = perf_counter()
+                    backend(test_surface, radius)
+                    timings[backend_name] = min(timings[backend_name], perf_counter() - start_time)
+
+            if timings:
+                _blur_decision_table[operation, size_class] = min(timings, key=timings.get), timings
+
+
+def get_blur_decision_table():
+    """
+    Getting the calibrated decisions
+    :return: dict of `(operation, size_class)` to `(fastest_backend_name, {backend_name: seconds})`
+    """
+    return {key: (backend_name, {**timings}) for key, (backend_name, timings) in _blur_decision_table.items()}
+
+
+def reset_blur_decision_table():
+    _blur_decision_table.clear()
+
+
+def _dispatch_blur(operation: str, source_surface: SurfaceType, radius: float | int):
+    if radius <= 0:
+        return source_surface.copy()
+
+    decision = _blur_decision_table.get((operation, get_blur_size_class(source_surface.get_size())))
+
+    if decision is not None:
+        return _blur_backends[operation][decision[0]](source_surface, radius)
+
+    for backend_name in BLUR_DEFAULT_BACKENDS:
+        if backend_name in _blur_backends[operation]:
+            return _blur_backends[operation][backend_name](source_surface, radius)
+
+    raise RuntimeError(f'There is no available backend for `{operation}`')
+
+
+def gaussian_blur(source_surface: SurfaceType, radius: float | int):
+    """
+    Gaussian blur by the fastest of available backends (`pygame-ce`, `Pillow`, `numpy`) for this size of Surface
+    (see `calibrate_blur_backends`). The radius is converted for every backend, so they blur equally up to rounding
+    :param source_surface: source Surface
+    :param radius: blur radius (the standard deviation of gaussian)
+    """
+    return _dispatch_blur(BLUR_OPERATION_GAUSSIAN, source_surface, radius)
+
+
+def box_blur(source_surface: SurfaceType, radius: float | int):
+    """
+    Box blur by the fastest of available backends (`pygame-ce`, `Pillow`, `numpy`) for this size of Surface
+    (see `calibrate_blur_backends`)
+    :param source_surface: source Surface
+    :param radius: blur radius, the box is `2 * round(radius) + 1` pixels wide
+    """
+    return _dispatch_blur(BLUR_OPERATION_BOX, source_surface, radius)
+
+
+class TransformPipeline:
+    """
+    Chain of operations, which are applied one after another to the same working Surface. The working Surface and
+    scratch Surfaces are reused between renders, so rendering of the same size does not allocate new Surfaces
+    """
+
+    def __init__(self, operations: Sequence[Sequence] = ()):
+        """
+        :param operations: sequence of tuples `(operation, *arguments)`, where the arguments are the same as
+        the arguments of the pipeline method with the name of the operation, for example `('blur', 5)`
+        """
+        self.operations: list[tuple] = [(*operation,) for operation in operations]
+        self._working_surface: SurfaceType | None = None
+
+    def fill(self, color: TYPE_COLOR):
+        self.operations.append((PIPELINE_OPERATION_FILL, color))
+        return self
+
+    def gradient(
+            self,
+            colors: Sequence[TYPE_COLOR],
+            is_vertical=False,
+            positions: Sequence[float] = ...,
+            angle: float = ...,
+            gradient_type=GRADIENT_TYPE_LINEAR,
+            dithering=False
+    ):
+        self.operations.append(
+            (PIPELINE_OPERATION_GRADIENT, colors, is_vertical, positions, angle, gradient_type, dithering)
+        )
+        return self
+
+    def round_corners(self, border_radius_or_radii: int | Sequence[int], antialiasing=False):
+        self.operations.append((PIPELINE_OPERATION_ROUND_CORNERS, border_radius_or_radii, antialiasing))
+        return self
+
+    def blur(self, radius: float | int, downsample: int = 1):
+        self.operations.append((PIPELINE_OPERATION_BLUR, radius, downsample))
+        return self
+
+    def tint(self, color: TYPE_COLOR):
+        """Multiplying the color of every pixel by the color (the alpha channel is kept)"""
+        self.operations.append((PIPELINE_OPERATION_TINT, color))
+        return self
+
+    def border(self, color: TYPE_COLOR, width: int, border_radius_or_radii: int | Sequence[int] = 0):
+        """Drawing the border, which pixels replace the pixels of the working Surface"""
+        self.operations.append((PIPELINE_OPERATION_BORDER, color, width, border_radius_or_radii))
+        return self
+
+    def render(self, size: Sequence[int]) -> SurfaceType:
+        """
+        Applying all the operations to the transparent Surface of the size. ATTENTION: the same Surface is returned
+        by every render of the same size, so it should be copied if it is needed after the next render
+        """
+        size = int(size[0]), int(size[1])
+
+        if self._working_surface is None or self._working_surface.get_size() != size:
+            self._working_surface = AlphaSurface(size)
+
+        working_surface = self._working_surface
+        working_surface.fill((0, 0, 0, 0))
+
+        for operation, *arguments in self.operations:
+            if operation == PIPELINE_OPERATION_FILL:
+                color = as_rgba(arguments[0])
+
+                if color is not None:
+                    working_surface.fill(color)
+            elif operation == PIPELINE_OPERATION_GRADIENT:
+                gradient(size, *arguments, dest_surface=working_surface)
+            elif operation == PIPELINE_OPERATION_ROUND_CORNERS:
+                radii, antialiasing = _as_radii(arguments[0]), arguments[1]
+                mask = _get_round_corners_mask(size, radii, antialiasing)
+
+                if antialiasing:
+                    working_surface.blit(mask, (0, 0), special_flags=BLEND_RGBA_MULT)
+                else:
+                    mask.to_surface(working_surface, setcolor=(0, 0, 0, 0), unsetcolor=None)
+            elif operation == PIPELINE_OPERATION_BLUR:
+                radius, downsample = arguments
+
+                if np is not None:
+                    blur(working_surface, radius, downsample, dest_surface=working_surface)
+                else:
+                    blurred_surface = gaussian_blur(working_surface, radius)
+                    working_surface.fill((0, 0, 0, 0))
+                    working_surface.blit(blurred_surface, (0, 0))
+            elif operation == PIPELINE_OPERATION_TINT:
+                color = as_rgba(arguments[0])
+
+                if color is not None:
+                    working_surface.fill((*color[:3], 0xff), special_flags=BLEND_RGBA_MULT)
+            elif operation == PIPELINE_OPERATION_BORDER:
+                color, width, radii = as_rgba(arguments[0]), arguments[1], _as_radii(arguments[2])
+
+                if color is not None and width > 0:
+                    if MAX_BORDER_RADIUS in radii:
+                        pg_draw_ellipse(working_surface, color, working_surface.get_rect(), width)
+                    else:
+                        pg_draw_rect(working_surface, color, working_surface.get_rect(), width, -1, *radii)
+            else:
+                raise ValueError(f'Unknown pipeline operation `{operation}`')
+
+        return working_surface
+
+
+def _as_radii(border_radius_or_radii: int | Sequence[int]):
+    if isinstance(border_radius_or_radii, int):
+        return (border_radius_or_radii,) * 4
+
+    return (*border_radius_or_radii,)
 
 
 __all__ = (
     'pillow_to_pygame',
     'pygame_to_pillow',
     'fast_gaussian_blur',
+    'ROUND_CORNERS_ANTIALIASING_SCALE',
+    'ROUND_CORNERS_MASK_CACHE_MAX_BYTES',
+    'round_corners_mask_cache',
     'cutout_by_mask',
+    'cutout_by_alpha_mask',
     'round_corners',
-    'gradient'
+    'GRADIENT_TYPE_LINEAR',
+    'GRADIENT_TYPE_RADIAL',
+    'GRADIENT_TYPE_CONIC',
+    'GRADIENT_LUT_SIZE',
+    'GRADIENT_LUT_CACHE_MAX_SIZE',
+    'gradient_lut_cache',
+    'get_gradient_lut',
+    'DEFAULT_BLUR_PASSES',
+    'BLUR_BUFFERS_CACHE_MAX_BYTES',
+    'PIPELINE_OPERATION_FILL',
+    'PIPELINE_OPERATION_GRADIENT',
+    'PIPELINE_OPERATION_ROUND_CORNERS',
+    'PIPELINE_OPERATION_BLUR',
+    'PIPELINE_OPERATION_TINT',
+    'PIPELINE_OPERATION_BORDER',
+    'BLUR_OPERATION_GAUSSIAN',
+    'BLUR_OPERATION_BOX',
+    'BLUR_BACKEND_PYGAME',
+    'BLUR_BACKEND_PILLOW',
+    'BLUR_BACKEND_NUMPY',
+    'BLUR_SIZE_CLASSES_BOUNDS',
+    'BLUR_CALIBRATION_SIZES',
+    'BLUR_DEFAULT_BACKENDS',
+    'gradient',
+    'blur',
+    'get_blur_size_class',
+    'get_blur_backends',
+    'calibrate_blur_backends',
+    'get_blur_decision_table',
+    'reset_blur_decision_table',
+    'gaussian_blur',
+    'box_blur',
+    'TransformPipeline'
 )
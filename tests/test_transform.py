@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+
+from pygame import SRCALPHA, Surface
+
+from pygex import transform
+from pygex.transform import (
+    BLUR_BACKEND_PILLOW,
+    BLUR_BACKEND_PYGAME,
+    BLUR_OPERATION_BOX,
+    BLUR_OPERATION_GAUSSIAN,
+    box_blur,
+    gaussian_blur
+)
+
+
+def _get_test_surface():
+    surface = Surface((16, 12), SRCALPHA)
+    surface.fill((200, 100, 50, 254))
+    surface.fill((10, 220, 30, 255), (4, 3, 5, 4))
+
+    return surface
+
+
+def _get_pixels(surface: Surface):
+    return [surface.get_at((x, y)) for x in range(surface.get_width()) for y in range(surface.get_height())]
+
+
+class BlurWithoutPillowTest(unittest.TestCase):
+    def setUp(self):
+        # the backends are used as if Pillow was not installed and the backends were never calibrated
+        backends = {
+            operation: {
+                backend_name: backend
+                for backend_name, backend in transform._blur_backends[operation].items()
+                if backend_name != BLUR_BACKEND_PILLOW
+            }
+            for operation in (BLUR_OPERATION_GAUSSIAN, BLUR_OPERATION_BOX)
+        }
+
+        for patcher in (
+                patch.dict(transform._blur_backends, backends),
+                patch.dict(transform._blur_decision_table, clear=True)
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_zero_radius_returns_copy(self):
+        surface = _get_test_surface()
+
+        for blur_function in (gaussian_blur, box_blur):
+            for radius in (0, -1):
+                blurred_surface = blur_function(surface, radius)
+
+                self.assertIsNot(blurred_surface, surface)
+                self.assertEqual(_get_pixels(blurred_surface), _get_pixels(surface))
+
+    def test_small_fractional_radius_is_not_blank(self):
+        surface = _get_test_surface()
+
+        for radius in (0.1, 0.3):
+            self.assertEqual(_get_pixels(gaussian_blur(surface, radius)), _get_pixels(surface))
+            self.assertEqual(_get_pixels(box_blur(surface, radius)), _get_pixels(surface))
+
+    def test_pygame_backend_small_fractional_radius(self):
+        surface = _get_test_surface()
+        pygame_gaussian_blur = transform._blur_backends[BLUR_OPERATION_GAUSSIAN][BLUR_BACKEND_PYGAME]
+
+        self.assertEqual(_get_pixels(pygame_gaussian_blur(surface, 0.3)), _get_pixels(surface))
+        self.assertNotEqual(pygame_gaussian_blur(surface, 2).get_at((0, 0)), (0, 0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()